@@ -0,0 +1,14 @@
+import asyncio
+import pathlib
+
+from twitchio import AssetCache
+
+
+def test_asset_cache_keeps_unrelated_files(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "important.txt").write_text("keep")
+    (tmp_path / ("a" * 64)).write_bytes(b"orphaned")
+    (tmp_path / ".0123abcd.part").write_bytes(b"interrupted")
+
+    asyncio.run(AssetCache(tmp_path)._load())
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["important.txt"]
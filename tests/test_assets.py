@@ -0,0 +1,31 @@
+import asyncio
+import pathlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from twitchio.assets import Asset
+
+
+class _HTTP:
+    asset_cache = None
+    heads: int = 0
+
+    async def _request_asset_head(self, url: str) -> dict[str, str]:
+        self.heads += 1
+        return {"Content-Type": "image/png"}
+
+    async def _request_asset(self, asset: Asset, *, chunk_size: int = 65536, offset: int = 0) -> AsyncIterator[bytes]:
+        asset._set_ext({"Content-Type": "image/png"})
+        yield b"image"[offset:]
+
+
+def test_save_resolves_extension_from_response(tmp_path: pathlib.Path) -> None:
+    http: Any = _HTTP()
+    asset = Asset("https://static-cdn.jtvnw.net/emoticons/v2/25/default/dark/3.0", http=http)
+
+    written: int = asyncio.run(asset.save(tmp_path))
+
+    assert written == 5
+    assert http.heads == 0
+    assert [path.name for path in tmp_path.iterdir()] == ["3.png"]
+    assert (tmp_path / "3.png").read_bytes() == b"image"
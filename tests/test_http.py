@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from twitchio.authentication import ManagedHTTPClient
+from twitchio.exceptions import HTTPException, HTTPTimeoutException
+from twitchio.http import Route
+
+
+async def _refresh_within_deadline() -> None:
+    client = ManagedHTTPClient(client_id="id", client_secret="secret")
+    client._app_token = "app"
+    client._set_token("123", "access", "refresh", scopes=[])
+
+    async def dispatch(route: Route, *, deadline: float | None) -> Any:
+        raise HTTPException(route=route, status=401, extra={"message": "Invalid OAuth token"})
+
+    async def refresh(user_id: str, refresh: str) -> Any:
+        await asyncio.sleep(1.0)
+        return client._tokens[user_id]
+
+    client._dispatch = dispatch  # type: ignore
+    client._refresh = refresh  # type: ignore
+
+    route = Route("GET", "users", token_for="123", timeout=0.2)
+    with pytest.raises(HTTPTimeoutException):
+        await asyncio.wait_for(client.request(route), 0.6)
+
+    client.cleanup()
+
+
+def test_deadline_covers_token_refresh() -> None:
+    asyncio.run(_refresh_within_deadline())
+
+
+async def _validation_survives_errors() -> None:
+    client = ManagedHTTPClient(client_id="id", client_secret="secret")
+    client._set_token("123", "access", "refresh", scopes=[])
+
+    async def revalidate(user_id: str, token: str) -> None:
+        raise RuntimeError("unexpected")
+
+    client._revalidate = revalidate  # type: ignore
+    del client._validation_due["123"]
+    await client._run_validation("123", "access")
+
+    # The token is scheduled to be validated again...
+    assert "123" in client._validation_due
+    client.cleanup()
+
+
+def test_validation_survives_unexpected_errors() -> None:
+    asyncio.run(_validation_survives_errors())
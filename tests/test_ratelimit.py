@@ -0,0 +1,74 @@
+import time
+
+from twitchio.ratelimit import RateLimiter, token_bucket_key
+
+
+def _update(limiter: RateLimiter, key: str, remaining: int, reset: float) -> None:
+    limiter.get(key).update({"Ratelimit-Limit": "800", "Ratelimit-Remaining": str(remaining), "Ratelimit-Reset": str(reset)})
+
+
+def test_best_tracks_most_available_bucket() -> None:
+    limiter = RateLimiter()
+    reset: float = time.time() + 60
+
+    for key in ("a", "b", "c"):
+        limiter.track(key)
+
+    _update(limiter, "a", 100, reset)
+    _update(limiter, "b", 500, reset)
+    _update(limiter, "c", 300, reset)
+
+    assert limiter.best() == ("b", 500)
+    assert limiter.best(lambda key: key != "b") == ("c", 300)
+
+    _update(limiter, "b", 50, reset)
+    assert limiter.best() == ("c", 300)
+
+    limiter.untrack("c")
+    assert limiter.best() == ("a", 100)
+
+
+def test_best_prefers_unknown_and_reset_buckets() -> None:
+    limiter = RateLimiter()
+    limiter.track("a")
+    _update(limiter, "a", 10, time.time() - 1)
+
+    # The reset time has passed, so the bucket is full again...
+    assert limiter.best() == ("a", 800)
+
+    limiter.track("b")
+    assert limiter.best()[0] == "b"
+
+
+def test_best_reranks_after_reset() -> None:
+    limiter = RateLimiter()
+    limiter.track("a")
+    limiter.track("b")
+
+    _update(limiter, "a", 0, time.time() + 0.05)
+    _update(limiter, "b", 400, time.time() + 60)
+    assert limiter.best() == ("b", 400)
+
+    time.sleep(0.1)
+    assert limiter.best() == ("a", 800)
+
+
+def test_token_bucket_key_hides_token() -> None:
+    key: str = token_bucket_key("secret-token")
+
+    assert "secret-token" not in key
+    assert key == token_bucket_key("secret-token")
+
+
+def test_prune_removes_idle_untracked_buckets() -> None:
+    limiter = RateLimiter()
+    limiter.track("tracked")
+
+    _update(limiter, "old", 10, time.time() - 1)
+    _update(limiter, "waiting", 10, time.time() + 60)
+    _update(limiter, "tracked", 10, time.time() - 1)
+
+    assert limiter.prune() == 1
+    assert "old" not in limiter
+    assert "waiting" in limiter
+    assert "tracked" in limiter
@@ -0,0 +1,131 @@
+import asyncio
+import pathlib
+
+from twitchio.authentication import JSONTokenStore, Scopes, SQLiteTokenStore
+from twitchio.types_.tokens import TokenMappingData
+
+
+SCOPES: list[str] = ["chat:read", "user:read:chat", "user:write:chat", "user:bot", "analytics:read:extensions"]
+
+
+def _token() -> TokenMappingData:
+    return {
+        "user_id": "123",
+        "token": "access",
+        "refresh": "refresh",
+        "last_validated": "2024-01-01T00:00:00",
+        "scopes": Scopes(SCOPES).selected,
+    }
+
+
+async def _round_trip(store: SQLiteTokenStore | JSONTokenStore) -> None:
+    token = _token()
+    await store.write({"123": token})
+
+    loaded = await store.load()
+    await store.close()
+
+    assert loaded == {"123": token}
+    assert Scopes(loaded["123"].get("scopes", [])) == Scopes(SCOPES)
+    assert "chat:read" in Scopes(loaded["123"].get("scopes", []))
+
+
+def test_sqlite_store_scopes_round_trip(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_round_trip(SQLiteTokenStore(tmp_path / "tokens.db")))
+
+
+def test_json_store_scopes_round_trip(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_round_trip(JSONTokenStore(tmp_path / "tokens.json")))
+
+
+def test_scopes_hashable() -> None:
+    assert len({Scopes(SCOPES), Scopes(reversed(SCOPES))}) == 1
+
+
+async def _shared_changes(path: pathlib.Path) -> None:
+    first = SQLiteTokenStore(path, shared=True)
+    second = SQLiteTokenStore(path, shared=True)
+    token = _token()
+
+    await second.load()
+    await first.write({"123": token})
+    assert await second.changes() == {"123": token}
+    assert await second.changes() == {}
+
+    token["token"] = "rotated"
+    await first.write({"123": token})
+    assert await second.changes() == {"123": token}
+    assert await first.changes() == {}
+
+    await first.close()
+    await second.close()
+
+
+def test_sqlite_store_shared_changes(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_shared_changes(tmp_path / "tokens.db"))
+
+
+async def _get_keeps_cursor(path: pathlib.Path) -> None:
+    first = SQLiteTokenStore(path, shared=True)
+    second = SQLiteTokenStore(path, shared=True)
+    x, y = _token(), _token()
+    y["user_id"] = "456"
+
+    await first.load()
+    await second.write({"123": x})
+    await second.write({"456": y})
+
+    # Reading a single user must not skip changes made to other users...
+    assert await first.get("456") == y
+    assert await first.changes() == {"123": x, "456": y}
+
+    await first.close()
+    await second.close()
+
+
+def test_sqlite_store_get_keeps_cursor(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_get_keeps_cursor(tmp_path / "tokens.db"))
+
+
+async def _shared_removal(path: pathlib.Path) -> None:
+    first = SQLiteTokenStore(path, shared=True)
+    second = SQLiteTokenStore(path, shared=True)
+
+    await first.write({"123": _token()})
+    await second.load()
+    await first.write({"123": None})
+
+    assert await second.changes() == {"123": None}
+    assert await second.get("123") is None
+    assert await second.load() == {}
+
+    await first.close()
+    await second.close()
+
+
+def test_sqlite_store_shared_removal(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_shared_removal(tmp_path / "tokens.db"))
+
+
+class _ShortLeaseStore(SQLiteTokenStore):
+    LEASE_TIME = 0.3
+
+
+async def _lease_renewed(path: pathlib.Path) -> None:
+    first = _ShortLeaseStore(path, shared=True)
+    second = _ShortLeaseStore(path, shared=True)
+
+    async with first.lock("123"):
+        await asyncio.sleep(1.0)
+
+        # The lease has been held for longer than LEASE_TIME, but is still owned by the first store...
+        assert not await second._run(second._acquire, "123")
+
+    assert await second._run(second._acquire, "123")
+
+    await first.close()
+    await second.close()
+
+
+def test_sqlite_store_lease_renewed(tmp_path: pathlib.Path) -> None:
+    asyncio.run(_lease_renewed(tmp_path / "tokens.db"))
@@ -0,0 +1,42 @@
+import asyncio
+
+from twitchio.utils import SingleFlight
+
+
+async def _shares_task() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls: list[int] = []
+
+    async def work() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    assert await asyncio.gather(flight.run("key", work), flight.run("key", work)) == [42, 42]
+    assert len(calls) == 1
+    assert "key" not in flight
+
+
+async def _cancel_unused(cancel_unused: bool) -> bool:
+    flight: SingleFlight[str, None] = SingleFlight(cancel_unused=cancel_unused)
+    finished: asyncio.Event = asyncio.Event()
+
+    async def work() -> None:
+        await asyncio.sleep(0.05)
+        finished.set()
+
+    waiter = asyncio.create_task(flight.run("key", work))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0.1)
+
+    return finished.is_set()
+
+
+def test_single_flight_shares_task() -> None:
+    asyncio.run(_shares_task())
+
+
+def test_single_flight_cancel_unused() -> None:
+    assert asyncio.run(_cancel_unused(False))
+    assert not asyncio.run(_cancel_unused(True))
@@ -37,10 +37,14 @@ from . import (  # noqa: F401
 )
 from .assets import Asset as Asset
 from .authentication import Scopes as Scopes
+from .backoff import RetryPolicy as RetryPolicy
+from .cache import AssetCache as AssetCache, ResponseCache as ResponseCache
 from .client import *
 from .enums import *
 from .exceptions import *
-from .http import HTTPAsyncIterator as HTTPAsyncIterator, Route as Route
+from .http import ConnectionPool as ConnectionPool, HTTPAsyncIterator as HTTPAsyncIterator, Route as Route
+from .loader import BatchLoader as BatchLoader, HelixLoader as HelixLoader
+from .metrics import HTTPMetrics as HTTPMetrics, RouteMetrics as RouteMetrics
 from .models import *
 from .payloads import *
 from .user import *
@@ -24,6 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import pathlib
@@ -36,7 +37,9 @@ from .exceptions import HTTPException
 
 if TYPE_CHECKING:
     import os
+    from collections.abc import AsyncIterator
 
+    from .cache import AssetCache
     from .http import HTTPClient
 
 
@@ -58,6 +61,9 @@ class Asset:
     Assets can be used to save or read from images or other media from Twitch.
     You can also retrieve the URL of the asset via the provided properties and methods.
 
+    When an :class:`~twitchio.AssetCache` is passed to the :class:`~twitchio.Client`, assets are read from the cache and only
+    downloaded when they are not cached.
+
     .. versionadded:: 3.0.0
         Added the asset class which will replace all
         previous properties of models with attached media URLs.
@@ -243,6 +249,10 @@ class Asset:
         str | None
             The file extension of the asset determined by the content type or ``None`` if it could not be determined.
         """
+        cache: AssetCache | None = self._http.asset_cache
+        if cache is not None and await cache.get(self) and self._ext:
+            return self._ext
+
         try:
             headers: dict[str, str] = await self._http._request_asset_head(self.url)
         except HTTPException:
@@ -250,17 +260,37 @@ class Asset:
 
         return self._set_ext(headers)
 
+    async def _stream(self, *, chunk_size: int, offset: int = 0) -> AsyncIterator[bytes]:
+        cache: AssetCache | None = self._http.asset_cache
+
+        if cache is None:
+            stream: AsyncIterator[bytes] = self._http._request_asset(self, chunk_size=chunk_size, offset=offset)
+        else:
+            stream = cache.stream(self, chunk_size=chunk_size, offset=offset)
+
+        async for chunk in stream:
+            yield chunk
+
     async def save(
         self,
         fp: str | os.PathLike[Any] | io.BufferedIOBase | None = None,
         seek_start: bool = True,
         force_extension: bool = True,
+        *,
+        chunk_size: int = 65536,
+        resume: bool = False,
     ) -> int:
         """Save this asset to a file or file-like object.
 
         If ``fp`` is ``None``, the asset will be saved to the current working directory with the
         asset's default qualified name.
 
+        The asset is streamed to ``fp`` in chunks as it is downloaded, without reading the whole asset into memory first.
+        Writes to files are made in a separate thread so they do not block the event loop.
+
+        .. versionchanged:: 3.3
+            The asset is now streamed to ``fp``. Added the ``chunk_size`` and ``resume`` parameters.
+
         Examples
         --------
 
@@ -284,6 +314,15 @@ class Asset:
                 await game.box_art.save("custom_name.png")
 
 
+        **Resume a partially saved asset**
+
+            .. code:: python3
+
+                # Only the remaining part of the asset is downloaded and appended to the file.
+
+                await clip.thumbnail.save("thumbnail.jpg", resume=True)
+
+
         **Save with a file-like object**
 
             .. code:: python3
@@ -312,6 +351,15 @@ class Asset:
 
             If no file extension was provided with ``fp`` setting ``force_extension`` to ``True``
             will force the file extension to match the content type provided by Twitch.
+        chunk_size: int
+            The size of the chunks to download and write at a time. Defaults to ``65536``.
+        resume: bool
+            Whether to resume saving a partially saved asset. When ``True``, only the part of the asset after the data
+            already in the file is downloaded and appended to it. For file-like objects the data is written from the current
+            position. Defaults to ``False``.
+
+            When the file name depends on an extension which is not known yet, the asset is first saved to a hidden
+            ``.part`` file in the same directory and renamed once downloaded, so that file is resumed instead.
 
         Returns
         -------
@@ -323,32 +371,60 @@ class Asset:
         FileNotFoundError
             Raised when ``fp`` is a directory or path to directory which can not be found or accessed.
         """
-        data: io.BytesIO = await self.read()
         written: int = 0
 
         if isinstance(fp, io.BufferedIOBase):
-            written = fp.write(data.read())
+            offset: int = fp.tell() if resume else 0
+
+            # In-memory buffers are written to directly; anything else may be backed by a file...
+            in_memory: bool = isinstance(fp, io.BytesIO)
+
+            async for chunk in self._stream(chunk_size=chunk_size, offset=offset):
+                written += fp.write(chunk) if in_memory else await asyncio.to_thread(fp.write, chunk)
 
             if seek_start:
                 fp.seek(0)
 
             return written
 
-        if not fp:
-            fp = pathlib.Path.cwd() / self.qualified_name
+        # The file name depends on the extension, which is only known once the response headers are received...
+        pending: bool = not self._ext and (
+            not fp or (force_extension and (isinstance(fp, str) or pathlib.Path(fp).is_dir()))
+        )
 
-        elif pathlib.Path(fp).is_dir():
-            fp = pathlib.Path(fp) / (self.qualified_name if force_extension else self.name)
+        path: pathlib.Path = pathlib.Path(self._save_path(fp, force_extension))
+        if pending:
+            # Saved to a temporary file in the same directory which is renamed once the download completes...
+            path = path.with_name(f".{path.name}.part")
+
+        new: io.BufferedWriter = await asyncio.to_thread(open, path, "ab" if resume else "wb")
+
+        try:
+            offset: int = new.tell()
 
-        elif isinstance(fp, str) and force_extension:
-            fp = f"{fp}{self._ext or ''}"
+            async for chunk in self._stream(chunk_size=chunk_size, offset=offset):
+                written += await asyncio.to_thread(new.write, chunk)
+        finally:
+            await asyncio.to_thread(new.close)
 
-        with open(fp, "wb") as new:
-            written = new.write(data.read())
+        if pending:
+            await asyncio.to_thread(path.replace, self._save_path(fp, force_extension))
 
         return written
 
-    async def read(self, *, seek_start: bool = True, chunk_size: int = 1024) -> io.BytesIO:
+    def _save_path(self, fp: str | os.PathLike[Any] | None, force_extension: bool) -> str | os.PathLike[Any]:
+        if not fp:
+            return pathlib.Path.cwd() / self.qualified_name
+
+        if pathlib.Path(fp).is_dir():
+            return pathlib.Path(fp) / (self.qualified_name if force_extension else self.name)
+
+        if isinstance(fp, str) and force_extension:
+            return f"{fp}{self._ext or ''}"
+
+        return fp
+
+    async def read(self, *, seek_start: bool = True, chunk_size: int = 65536) -> io.BytesIO:
         """Read from the asset and return an :class:`io.BytesIO` buffer.
 
         You can use this method to save the asset to memory and use it later.
@@ -371,7 +447,10 @@ class Asset:
         seek_start: bool
             Whether to seek to the start of the buffer after successfully writing data. Defaults to ``True``.
         chunk_size: int
-            The size of the chunk to use when reading from the asset. Defaults to ``1024``.
+            The size of the chunk to use when reading from the asset. Defaults to ``65536``.
+
+            .. versionchanged:: 3.3
+                The default was changed from ``1024``.
 
         Returns
         -------
@@ -380,7 +459,7 @@ class Asset:
         """
         fp: io.BytesIO = io.BytesIO()
 
-        async for chunk in self._http._request_asset(self, chunk_size=chunk_size):
+        async for chunk in self._stream(chunk_size=chunk_size):
             fp.write(chunk)
 
         if seek_start:
@@ -25,4 +25,5 @@ SOFTWARE.
 from .oauth import OAuth as OAuth
 from .payloads import *
 from .scopes import Scopes as Scopes
+from .store import *
 from .tokens import ManagedHTTPClient as ManagedHTTPClient
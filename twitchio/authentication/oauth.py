@@ -27,7 +27,7 @@ from __future__ import annotations
 import asyncio
 import secrets
 import urllib.parse
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Unpack
 
 import twitchio
 
@@ -40,6 +40,7 @@ from .payloads import *
 if TYPE_CHECKING:
     import aiohttp
 
+    from ..types_.options import HTTPClientOptions
     from ..types_.responses import (
         AuthorizationURLResponse,
         ClientCredentialsResponse,
@@ -63,8 +64,9 @@ class OAuth(HTTPClient):
         redirect_uri: str | None = None,
         scopes: Scopes | None = None,
         session: aiohttp.ClientSession = MISSING,
+        **options: Unpack[HTTPClientOptions],
     ) -> None:
-        super().__init__(session=session, client_id=client_id)
+        super().__init__(session=session, client_id=client_id, **options)
 
         self.client_id = client_id
         self.client_secret = client_secret
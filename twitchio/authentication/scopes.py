@@ -24,34 +24,56 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import functools
 import urllib.parse
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Self
 
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
 
+# Every scope is assigned a bit in the order they are defined on Scopes. Bits are not stable between versions...
+_SCOPES: list[_scope_property] = []
+_LOOKUP: dict[str, _scope_property] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _selected(mask: int) -> tuple[str, ...]:
+    return tuple(scope._value for scope in _SCOPES if mask & scope._bit)
+
+
+@functools.lru_cache(maxsize=1024)
+def _urlsafe(mask: int, unquote: bool) -> str:
+    return "+".join([scope._value if unquote else scope._quoted for scope in _SCOPES if mask & scope._bit])
+
+
 class _scope_property:
     def __set_name__(self, owner: type[Scopes], name: str) -> None:
         self._name = name
+        self._value: str = name.replace("_", ":", 2)
+        self._quoted: str = urllib.parse.quote(self._value)
+        self._bit: int = 1 << len(_SCOPES)
+
+        _SCOPES.append(self)
+        _LOOKUP[self._value] = _LOOKUP[name] = self
 
     def __get__(self, *_: object) -> _scope_property:
         return self
 
     def __set__(self, instance: Scopes, value: bool) -> None:
         if value is True:
-            instance._selected.add(self)
+            instance._mask |= self._bit
         elif value is False:
-            instance._selected.discard(self)
+            instance._mask &= ~self._bit
         else:
             raise TypeError(f"Expected bool for scope, got {type(value).__name__}")
 
     def __str__(self) -> str:
-        return self._name.replace("_", ":", 2)
+        return self._value
 
     def quoted(self) -> str:
-        return urllib.parse.quote(str(self))
+        return self._quoted
 
     @property
     def name(self) -> str:
@@ -96,6 +118,14 @@ class Scopes(metaclass=_ScopeMeta):
 
     All scopes on this class are special descriptors.
 
+    Selected scopes are stored as an integer bitmask, which makes membership checks and set operations cheap. Scopes support
+    ``|`` (union), ``&`` (intersection) and ``-`` (difference), and can be compared with ``<=`` and ``>=`` to check whether
+    one set of scopes is a subset or superset of another.
+
+    .. versionchanged:: 3.3
+
+        Scopes are now backed by an integer bitmask and support set operations.
+
     Attributes
     ----------
     analytics_read_extensions
@@ -262,7 +292,7 @@ class Scopes(metaclass=_ScopeMeta):
         Equivalent to the ``whispers:edit`` scope on Twitch.
     """
 
-    __slots__ = ("_selected",)
+    __slots__ = ("_mask",)
 
     analytics_read_extensions = _scope_property()
     analytics_read_games = _scope_property()
@@ -349,42 +379,40 @@ class Scopes(metaclass=_ScopeMeta):
     def __init__(self, scopes: Iterable[str | _scope_property] | None = None, /, **kwargs: bool) -> None:
         if scopes is None:
             scopes = []
-        self._selected: set[_scope_property] = set()
+        self._mask: int = 0
 
-        prop: _scope_property
+        prop: _scope_property | None
 
         for scope in scopes:
             if isinstance(scope, str):
-                if scope == "openid":
-                    continue
+                # Unknown scopes, including "openid", are ignored...
+                prop = _LOOKUP.get(scope)
 
-                attr_name = scope.replace(":", "_")
-
-                if not hasattr(self, attr_name):
+                if prop is None:
                     continue
 
-                prop = getattr(self, attr_name)
-
             elif isinstance(scope, _scope_property):  # type: ignore[unnecessary-isinstance]
                 prop = scope
 
             else:
                 raise TypeError(f"Invalid scope provided: {type(scope)} is not a valid scope.")
 
-            self._selected.add(prop)
+            self._mask |= prop._bit
 
         for key, value in kwargs.items():
-            prop = getattr(self, key)
+            prop = _LOOKUP.get(key)
+            if prop is None:
+                raise AttributeError(f"'Scopes' object has no attribute '{key}'")
 
             if value is True:
-                self._selected.add(prop)
+                self._mask |= prop._bit
             elif value is False:
-                self._selected.discard(prop)
+                self._mask &= ~prop._bit
             else:
                 raise TypeError(f'Expected bool for scope kwarg "{key}", got {type(value).__name__}')
 
     def __iter__(self) -> Iterator[str]:
-        return iter([str(scope) for scope in self._selected])
+        return iter(_selected(self._mask))
 
     def __repr__(self) -> str:
         return f"<Scopes selected={list(self)}>"
@@ -394,9 +422,83 @@ class Scopes(metaclass=_ScopeMeta):
 
     def __contains__(self, scope: _scope_property | str, /) -> bool:
         if isinstance(scope, str):
-            return any(s.value == scope for s in self._selected)
+            prop: _scope_property | None = _LOOKUP.get(scope)
+            return prop is not None and bool(self._mask & prop._bit)
+
+        return bool(self._mask & scope._bit)
 
-        return scope in self._selected
+    def __eq__(self, other: object, /) -> bool:
+        if not isinstance(other, Scopes):
+            return NotImplemented
+
+        return self._mask == other._mask
+
+    def __hash__(self) -> int:
+        return hash(self._mask)
+
+    def __or__(self, other: Scopes, /) -> Self:
+        if not isinstance(other, Scopes):  # type: ignore[unnecessary-isinstance]
+            return NotImplemented
+
+        return self.from_value(self._mask | other._mask)
+
+    def __and__(self, other: Scopes, /) -> Self:
+        if not isinstance(other, Scopes):  # type: ignore[unnecessary-isinstance]
+            return NotImplemented
+
+        return self.from_value(self._mask & other._mask)
+
+    def __sub__(self, other: Scopes, /) -> Self:
+        if not isinstance(other, Scopes):  # type: ignore[unnecessary-isinstance]
+            return NotImplemented
+
+        return self.from_value(self._mask & ~other._mask)
+
+    def __le__(self, other: Scopes, /) -> bool:
+        if not isinstance(other, Scopes):  # type: ignore[unnecessary-isinstance]
+            return NotImplemented
+
+        return self._mask & ~other._mask == 0
+
+    def __ge__(self, other: Scopes, /) -> bool:
+        if not isinstance(other, Scopes):  # type: ignore[unnecessary-isinstance]
+            return NotImplemented
+
+        return other._mask & ~self._mask == 0
+
+    def issubset(self, other: Scopes, /) -> bool:
+        """Method which returns whether every scope selected on this object is also selected on ``other``.
+
+        Equivalent to ``self <= other``.
+        """
+        return self._mask & ~other._mask == 0
+
+    def issuperset(self, other: Scopes, /) -> bool:
+        """Method which returns whether every scope selected on ``other`` is also selected on this object.
+
+        Equivalent to ``self >= other``.
+        """
+        return other._mask & ~self._mask == 0
+
+    @property
+    def value(self) -> int:
+        """Property that returns the selected scopes as an integer bitmask.
+
+        Use :meth:`.from_value` to recreate this object from the returned ``int``.
+
+        .. warning::
+
+            The bit assigned to each scope may change between versions of TwitchIO. Use :attr:`.selected` when storing scopes.
+        """
+        return self._mask
+
+    @classmethod
+    def from_value(cls, value: int, /) -> Self:
+        """Classmethod which creates this :class:`.Scopes` object from an integer bitmask returned by :attr:`.value`."""
+        self = cls()
+        self._mask = value & ((1 << len(_SCOPES)) - 1)
+
+        return self
 
     def urlsafe(self, *, unquote: bool = False) -> str:
         """Method which returns a URL-Safe formatted ``str`` of selected scopes.
@@ -409,7 +511,7 @@ class Scopes(metaclass=_ScopeMeta):
             If this is ``True``, this will return scopes without URL quoting, E.g. as ``user:read:email+channel:bot``
             compared to ``user%3Aread%3Aemail+channel%3Abot``. Defaults to ``False``.
         """
-        return "+".join([scope.value if unquote else scope.quoted() for scope in self._selected])
+        return _urlsafe(self._mask, unquote)
 
     @property
     def selected(self) -> list[str]:
@@ -422,7 +524,7 @@ class Scopes(metaclass=_ScopeMeta):
     @classmethod
     def all(cls) -> Scopes:
         """Classmethod which creates this :class:`.Scopes` object with all scopes selected."""
-        return cls([scope for scope in cls.__dict__.values() if isinstance(scope, _scope_property)])
+        return cls.from_value((1 << len(_SCOPES)) - 1)
 
     @classmethod
     def from_url(cls, url: str) -> Scopes:
@@ -443,13 +545,10 @@ class Scopes(metaclass=_ScopeMeta):
                 scopes.extend(splat)
 
         for scope in scopes:
-            if scope == "openid":
-                continue
-
-            prop = getattr(self, scope.replace(":", "_"), None)
-            if not prop:
+            prop: _scope_property | None = _LOOKUP.get(scope)
+            if prop is None:
                 continue
 
-            self._selected.add(prop)
+            self._mask |= prop._bit
 
         return self
@@ -0,0 +1,424 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import json
+import logging
+import pathlib
+import secrets
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import AsyncIterator, Callable, Mapping
+
+    from ..types_.tokens import TokenMapping, TokenMappingData
+
+
+__all__ = ("JSONTokenStore", "SQLiteTokenStore", "TokenStore")
+
+
+T = TypeVar("T")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def write_tokens(path: pathlib.Path, tokens: TokenMapping) -> None:
+    # Written to a temporary file and renamed so an interrupted write does not lose every token...
+    tmp: pathlib.Path = path.with_name(f".{path.name}.{secrets.token_hex(4)}")
+
+    try:
+        with open(tmp, "w", encoding="UTF-8") as fp:
+            json.dump(tokens, fp)
+
+        tmp.replace(path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+class TokenStore(abc.ABC):
+    """Base class used to implement persistent storage of the user tokens managed by a :class:`~twitchio.Client`.
+
+    When a store is passed to :class:`~twitchio.Client` with the ``token_store`` parameter, tokens are loaded from the store
+    during :meth:`~twitchio.Client.load_tokens` and only the tokens which changed are written to the store as soon as they
+    are added, refreshed, validated or removed, instead of every token being saved when the client closes.
+
+    Some built-in stores already exist:
+
+    - :class:`~twitchio.authentication.SQLiteTokenStore`
+
+    - :class:`~twitchio.authentication.JSONTokenStore`
+
+    A store can be shared by multiple processes, E.g. when running multiple :class:`~twitchio.AutoClient` shards. Twitch
+    rotates the refresh token of a user every time it is used, so processes sharing tokens must coordinate refreshes. Shared
+    stores should set :attr:`shared` to ``True`` and implement :meth:`lock`, :meth:`get` and :meth:`changes`.
+
+    .. versionadded:: 3.3
+
+    .. note::
+
+        Every abstract method must be implemented in subclasses.
+
+    Attributes
+    ----------
+    shared: bool
+        Whether this store is shared with other processes. When ``True``, the client holds :meth:`lock` while refreshing a
+        token, uses the token from :meth:`get` if another process already refreshed it, and applies tokens changed by
+        other processes from :meth:`changes` every :attr:`poll_interval` seconds. Defaults to ``False``.
+    poll_interval: float
+        The time in seconds between checking for tokens changed by other processes. Defaults to ``5.0``.
+    """
+
+    shared: bool = False
+    poll_interval: float = 5.0
+
+    @abc.abstractmethod
+    async def load(self) -> TokenMapping:
+        """|coro|
+
+        Base method which should be implemented to return every stored token, keyed by user ID.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def write(self, changes: Mapping[str, TokenMappingData | None]) -> None:
+        """|coro|
+
+        Base method which should be implemented to persist changed tokens.
+
+        Parameters
+        ----------
+        changes: Mapping[str, TokenMappingData | None]
+            A mapping of user ID to the current token of each changed user. A value of ``None`` means the token of that
+            user was removed and should be deleted from the store.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Method which can be implemented to release any resources held by the store. Called when the client closes.
+        """
+        return
+
+    @contextlib.asynccontextmanager
+    async def lock(self, user_id: str) -> AsyncIterator[None]:
+        """Method which can be implemented to return an async context manager which excludes other processes from
+        refreshing the token of the provided user while it is held.
+
+        By default this does nothing.
+        """
+        yield
+
+    async def get(self, user_id: str) -> TokenMappingData | None:
+        """|coro|
+
+        Method which can be implemented to return the currently stored token of a single user, or ``None``.
+
+        By default this returns ``None``.
+        """
+        return None
+
+    async def changes(self) -> Mapping[str, TokenMappingData | None]:
+        """|coro|
+
+        Method which can be implemented to return the tokens written by other processes since this method was last called,
+        or since :meth:`load` was called. Like :meth:`write`, a value of ``None`` means the token of that user was removed.
+
+        By default this returns an empty :class:`dict`.
+        """
+        return {}
+
+
+class JSONTokenStore(TokenStore):
+    """A :class:`TokenStore` which stores tokens in a JSON file, in the same format as :meth:`~twitchio.Client.save_tokens`.
+
+    The whole file is rewritten in a background thread when tokens change. It is first written to a temporary file which is
+    then renamed, so a crash while writing never leaves a partially written file behind.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: str | os.PathLike[str]
+        The path of the file to store tokens in. Defaults to ``".tio.tokens.json"``.
+    """
+
+    __slots__ = ("_lock", "_tokens", "path")
+
+    def __init__(self, path: str | os.PathLike[str] = ".tio.tokens.json") -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self._tokens: TokenMapping | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    def __repr__(self) -> str:
+        return f"JSONTokenStore(path={str(self.path)!r})"
+
+    def _read(self) -> TokenMapping:
+        try:
+            with open(self.path, encoding="UTF-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    async def load(self) -> TokenMapping:
+        async with self._lock:
+            self._tokens = await asyncio.to_thread(self._read)
+            return dict(self._tokens)
+
+    async def write(self, changes: Mapping[str, TokenMappingData | None]) -> None:
+        async with self._lock:
+            if self._tokens is None:
+                self._tokens = await asyncio.to_thread(self._read)
+
+            for user_id, data in changes.items():
+                if data is None:
+                    self._tokens.pop(user_id, None)
+                else:
+                    self._tokens[user_id] = data
+
+            await asyncio.to_thread(write_tokens, self.path, dict(self._tokens))
+
+
+class SQLiteTokenStore(TokenStore):
+    """A :class:`TokenStore` which stores tokens in an SQLite database, using the built-in :mod:`sqlite3` module.
+
+    Each changed token is written as a single row, so persisting a refresh costs the same regardless of how many tokens are
+    stored. All queries are run on a dedicated worker thread and never block the event loop.
+
+    The database is opened in WAL mode, and can be shared by multiple processes on the same machine with ``shared=True``.
+    Refreshes are then coordinated with a short lease per user stored in the database, which is renewed until the refresh
+    completes. Only a single process refreshes a token at once and the others pick up the refreshed token instead of using
+    the rotated refresh token. Removed tokens are kept as a row without a token, so other processes also remove them.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    path: str | os.PathLike[str]
+        The path of the database file. Defaults to ``".tio.tokens.db"``.
+    shared: bool
+        Whether the database is shared with other processes. Defaults to ``False``.
+    poll_interval: float
+        The time in seconds between checking for tokens changed by other processes, when ``shared`` is ``True``.
+        Defaults to ``5.0``.
+    """
+
+    SCHEMA: ClassVar[str] = (
+        "CREATE TABLE IF NOT EXISTS tokens ("
+        "user_id TEXT PRIMARY KEY, token TEXT NOT NULL, refresh TEXT NOT NULL, last_validated TEXT NOT NULL, "
+        "scopes TEXT NOT NULL DEFAULT '', seq INTEGER NOT NULL DEFAULT 0, writer TEXT NOT NULL DEFAULT '', "
+        "removed INTEGER NOT NULL DEFAULT 0);"
+        "CREATE INDEX IF NOT EXISTS tokens_seq ON tokens (seq);"
+        "CREATE TABLE IF NOT EXISTS sequence (value INTEGER NOT NULL);"
+        "INSERT INTO sequence SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM sequence);"
+        "CREATE TABLE IF NOT EXISTS leases (user_id TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL);"
+    )
+    LEASE_TIME: ClassVar[float] = 30.0
+
+    __slots__ = ("_conn", "_executor", "_id", "_last_change", "path", "poll_interval", "shared")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ".tio.tokens.db",
+        *,
+        shared: bool = False,
+        poll_interval: float = 5.0,
+    ) -> None:
+        self.path: pathlib.Path = pathlib.Path(path)
+        self.shared: bool = shared
+        self.poll_interval: float = poll_interval
+
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._conn: sqlite3.Connection | None = None
+        self._id: str = secrets.token_hex(8)
+        self._last_change: int = 0
+
+    def __repr__(self) -> str:
+        return f"SQLiteTokenStore(path={str(self.path)!r})"
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        # sqlite3 connections may only be used from the thread which created them...
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="twitchio-tokens")
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=self.LEASE_TIME)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self.SCHEMA)
+
+        return self._conn
+
+    def _select(
+        self, where: str = "", params: tuple[Any, ...] = (), *, advance: bool = True
+    ) -> dict[str, TokenMappingData | None]:
+        query: str = f"SELECT user_id, token, refresh, last_validated, scopes, seq, removed FROM tokens {where}"
+        tokens: dict[str, TokenMappingData | None] = {}
+
+        for row in self._connect().execute(query, params):
+            # Removed tokens are kept as a row without a token so other processes are told about the removal...
+            tokens[row[0]] = (
+                None
+                if row[6]
+                else {
+                    "user_id": row[0],
+                    "token": row[1],
+                    "refresh": row[2],
+                    "last_validated": row[3],
+                    "scopes": row[4].split(),
+                }
+            )
+
+            # Only a full load or poll may move the cursor, otherwise changes to other users would be skipped...
+            if advance:
+                self._last_change = max(self._last_change, row[5])
+
+        return tokens
+
+    def _load(self) -> TokenMapping:
+        return {user_id: data for user_id, data in self._select().items() if data is not None}
+
+    def _get(self, user_id: str) -> TokenMappingData | None:
+        return self._select("WHERE user_id = ?", (user_id,), advance=False).get(user_id)
+
+    def _changes(self) -> dict[str, TokenMappingData | None]:
+        return self._select("WHERE seq > ? AND writer != ?", (self._last_change, self._id))
+
+    def _acquire(self, user_id: str) -> bool:
+        conn: sqlite3.Connection = self._connect()
+        now: float = time.time()
+
+        with conn:
+            conn.execute("DELETE FROM leases WHERE user_id = ? AND expires < ?", (user_id, now))
+            conn.execute("INSERT OR IGNORE INTO leases VALUES (?, ?, ?)", (user_id, self._id, now + self.LEASE_TIME))
+            owner: str = conn.execute("SELECT owner FROM leases WHERE user_id = ?", (user_id,)).fetchone()[0]
+
+        return owner == self._id
+
+    def _renew(self, user_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE leases SET expires = ? WHERE user_id = ? AND owner = ?",
+                (time.time() + self.LEASE_TIME, user_id, self._id),
+            )
+
+    def _release(self, user_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM leases WHERE user_id = ? AND owner = ?", (user_id, self._id))
+
+    def _write(self, changes: Mapping[str, TokenMappingData | None]) -> None:
+        conn: sqlite3.Connection = self._connect()
+        with conn:
+            # The sequence is incremented while holding the write lock, so writes are always seen in commit order...
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("UPDATE sequence SET value = value + 1")
+            seq: int = conn.execute("SELECT value FROM sequence").fetchone()[0]
+
+            rows: list[tuple[str, str, str, str, str, int, str, bool]] = [
+                (
+                    user_id,
+                    data["token"],
+                    data["refresh"],
+                    data["last_validated"],
+                    " ".join(data.get("scopes", [])),
+                    seq,
+                    self._id,
+                    False,
+                )
+                if data is not None
+                else (user_id, "", "", "", "", seq, self._id, True)
+                for user_id, data in changes.items()
+            ]
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO tokens (user_id, token, refresh, last_validated, scopes, seq, writer, removed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def load(self) -> TokenMapping:
+        return await self._run(self._load)
+
+    async def write(self, changes: Mapping[str, TokenMappingData | None]) -> None:
+        await self._run(self._write, changes)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, user_id: str) -> AsyncIterator[None]:
+        if not self.shared:
+            yield
+            return
+
+        while not await self._run(self._acquire, user_id):
+            await asyncio.sleep(0.1)
+
+        # A refresh may take longer than the lease, E.g. while retrying, so the lease is renewed until released...
+        renewer: asyncio.Task[None] = asyncio.create_task(self._keep_lease(user_id))
+
+        try:
+            yield
+        finally:
+            renewer.cancel()
+            await self._run(self._release, user_id)
+
+    async def _keep_lease(self, user_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.LEASE_TIME / 3)
+
+            try:
+                await self._run(self._renew, user_id)
+            except sqlite3.Error as e:
+                logger.debug('Unable to renew the refresh lease for "%s": %s', user_id, e)
+
+    async def get(self, user_id: str) -> TokenMappingData | None:
+        return await self._run(self._get, user_id)
+
+    async def changes(self) -> dict[str, TokenMappingData | None]:
+        return await self._run(self._changes)
+
+    async def close(self) -> None:
+        if self._executor is None:
+            return
+
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
+        self._executor = None
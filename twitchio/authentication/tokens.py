@@ -26,9 +26,14 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import heapq
 import json
 import logging
-from typing import TYPE_CHECKING, Any, TypeVar
+import math
+import pathlib
+import random
+import time
+from typing import TYPE_CHECKING, ClassVar, TypeVar, Unpack
 
 import aiohttp
 
@@ -36,18 +41,24 @@ from ..backoff import Backoff
 from ..exceptions import HTTPException, InvalidTokenException
 from ..http import HTTPAsyncIterator, PaginatedConverter
 from ..payloads import TokenRefreshedPayload
-from ..utils import MISSING
+from ..ratelimit import token_bucket_key
+from ..utils import MISSING, SingleFlight
 from .oauth import OAuth
 from .scopes import Scopes
+from .store import write_tokens
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
     from twitchio.http import Route
     from twitchio.types_.responses import RawResponse
 
     from ..client import Client
+    from ..types_.options import HTTPClientOptions
     from ..types_.tokens import TokenMapping, TokenMappingData, _TokenRefreshedPayload
     from .payloads import ClientCredentialsPayload, RefreshTokenPayload, ValidateTokenPayload
+    from .store import TokenStore
 
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -57,6 +68,9 @@ T = TypeVar("T")
 
 
 class ManagedHTTPClient(OAuth):
+    VALIDATE_INTERVAL: ClassVar[float] = 3300.0
+    REFRESH_THRESHOLD: ClassVar[int] = 3600
+
     def __init__(
         self,
         *,
@@ -66,6 +80,7 @@ class ManagedHTTPClient(OAuth):
         scopes: Scopes | None = None,
         session: aiohttp.ClientSession = MISSING,
         client: Client | None = None,
+        **options: Unpack[HTTPClientOptions],
     ) -> None:
         super().__init__(
             client_id=client_id,
@@ -73,22 +88,48 @@ class ManagedHTTPClient(OAuth):
             redirect_uri=redirect_uri,
             scopes=scopes,
             session=session,
+            **options,
         )
+
+        # The isolated client shares our pool of connections, which is closed by us...
+        isolated_options: HTTPClientOptions = {**options, "connection_pool": self._pool, "metrics": self._metrics}
         self.__isolated: OAuth = OAuth(
             client_id=client_id,
             client_secret=client_secret,
             redirect_uri=redirect_uri,
             scopes=scopes,
             session=session,
+            **isolated_options,
         )
 
         self._tokens: TokenMapping = {}
+        # Reverse index of token to User ID, maintained by _set_token and remove_token...
+        self._token_index: dict[str, str] = {}
+        self._refreshing: SingleFlight[str, TokenMappingData] = SingleFlight()
+        self._scopes: dict[str, Scopes] = {}
         self._app_token: str | None = None
+        self._token_routing: bool = options.get("token_routing", False)
 
         self._token_lock: asyncio.Lock = asyncio.Lock()
         self._has_loaded: bool = False
         self._backoff: Backoff = Backoff(base=3, maximum_time=90)
 
+        # Tokens are validated by a scheduler, ordered by when they are next due using monotonic time...
+        self._validation_queue: list[tuple[float, str, str]] = []
+        self._validation_due: dict[str, float] = {}
+        self._refresh_at: dict[str, float] = {}
+        self._validation_wakeup: asyncio.Event = asyncio.Event()
+        self._validation_semaphore: asyncio.Semaphore = asyncio.Semaphore(options.get("validation_concurrency", 10))
+        self._validation_jitter: float = options.get("validation_jitter", 60.0)
+        self._defer_validation: bool = options.get("defer_validation", False)
+
+        # Changed tokens are written to the store in the background, coalescing changes made while a write is pending...
+        self._store: TokenStore | None = options.get("token_store")
+        self._store_dirty: set[str] = set()
+        self._store_task: asyncio.Task[None] | None = None
+        self._poll_task: asyncio.Task[None] | None = None
+        self._app_refresh_task: asyncio.Task[None] | None = None
+
         self._validate_task: asyncio.Task[None] | None = None
         self._client = client
 
@@ -128,20 +169,20 @@ class ManagedHTTPClient(OAuth):
 
             return valid_resp
 
-        self._tokens[valid_resp.user_id] = {
-            "user_id": valid_resp.user_id,
-            "token": resp.access_token,
-            "refresh": resp.refresh_token,
-            "last_validated": datetime.datetime.now().isoformat(),
-        }
+        self._set_token(
+            valid_resp.user_id,
+            resp.access_token,
+            resp.refresh_token,
+            scopes=valid_resp.scopes,
+            expires_in=valid_resp.expires_in,
+        )
 
         self._dispatch_event(valid_resp.user_id, resp)
         logger.info('Token successfully added to %r after refresh: "%s"', self, valid_resp.user_id)
         return valid_resp
 
     async def add_token(self, token: str, refresh: str) -> ValidateTokenPayload:
-        if not self._validate_task:
-            self._validate_task = asyncio.create_task(self.__validate_loop())
+        self._start_tasks()
 
         try:
             resp: ValidateTokenPayload = await self.__isolated.validate_token(token)
@@ -159,22 +200,61 @@ class ManagedHTTPClient(OAuth):
 
             return resp
 
-        if resp.expires_in <= 3600:
+        if resp.expires_in <= self.REFRESH_THRESHOLD:
             logger.debug("Token expires in %s seconds. Attempting to refresh.", resp.expires_in)
             return await self._attempt_refresh_on_add(token, refresh)
 
-        self._tokens[resp.user_id] = {
-            "user_id": resp.user_id,
+        self._set_token(resp.user_id, token, refresh, scopes=resp.scopes, expires_in=resp.expires_in)
+
+        logger.debug('Token successfully added to %r: "%s"', self, resp.user_id)
+        return resp
+
+    def _set_token(
+        self,
+        user_id: str,
+        token: str,
+        refresh: str,
+        *,
+        scopes: Iterable[str] | Scopes,
+        expires_in: int | None = None,
+        last_validated: str | None = None,
+        elapsed: float = 0.0,
+    ) -> TokenMappingData:
+        old: TokenMappingData | None = self._tokens.get(user_id)
+        if old and self._token_index.get(old["token"]) == user_id:
+            del self._token_index[old["token"]]
+
+        selected: Scopes = Scopes.from_value(scopes.value) if isinstance(scopes, Scopes) else Scopes(scopes)
+        data: TokenMappingData = {
+            "user_id": user_id,
             "token": token,
             "refresh": refresh,
-            "last_validated": datetime.datetime.now().isoformat(),
+            "last_validated": last_validated or datetime.datetime.now().isoformat(),
+            "scopes": selected.selected,
         }
 
-        logger.debug('Token successfully added to %r: "%s"', self, resp.user_id)
-        return resp
+        self._tokens[user_id] = data
+        self._token_index[token] = user_id
+        self._scopes[user_id] = selected
+        self._ratelimiter.track(user_id)
+        self._schedule_validation(user_id, token, expires_in, elapsed=elapsed)
+        self._mark_dirty(user_id)
+
+        return data
 
     def remove_token(self, user_id: str) -> TokenMappingData | None:
         data: TokenMappingData | None = self._tokens.pop(user_id, None)
+        self._scopes.pop(user_id, None)
+        self._validation_due.pop(user_id, None)
+        self._refresh_at.pop(user_id, None)
+        self._ratelimiter.untrack(user_id)
+
+        if data and self._token_index.get(data["token"]) == user_id:
+            del self._token_index[data["token"]]
+
+        if data:
+            self._mark_dirty(user_id)
+
         return data
 
     def _find_token(self, route: Route) -> TokenMappingData | None | str:
@@ -190,20 +270,53 @@ class ManagedHTTPClient(OAuth):
             if scoped:
                 return scoped
 
-        for data in self._tokens.values():
-            if data["token"] == token:
-                return data
+        if token:
+            user_id: str | None = self._token_index.get(token)
+            if user_id is not None:
+                return self._tokens[user_id]
 
         return token or self._app_token
 
-    async def request(self, route: Route) -> RawResponse | str | None:
-        old: TokenMappingData | None | str = self._find_token(route)
+    def _route_token(self, route: Route) -> TokenMappingData | None | str:
+        # Rate limits are bucketed per token, so spread requests over the token with the most remaining budget...
+        user_id: str | None
+        available: float
+
+        if route.scopes:
+            required: Scopes = Scopes(route.scopes)
+
+            def has_scopes(user_id: str) -> bool:
+                scopes: Scopes | None = self._scopes.get(user_id)
+                return scopes is not None and scopes >= required
+
+            user_id, available = self._ratelimiter.best(has_scopes)
+
+        else:
+            user_id, available = self._ratelimiter.best()
+
+            if self._app_token and self._ratelimiter.available("app") >= available:
+                return self._app_token
+
+        best: TokenMappingData | None = self._tokens.get(user_id) if user_id else None
+        return best or self._find_token(route)
+
+    async def _send(self, route: Route, *, deadline: float | None) -> RawResponse | str | None:
+        routed: bool = (
+            self._token_routing and route.routable and not route.token_for and "Authorization" not in route.headers
+        )
+        old: TokenMappingData | None | str = self._route_token(route) if routed else self._find_token(route)
         if old:
             token: str = old if isinstance(old, str) else old["token"]
             route.update_headers({"Authorization": f"Bearer {token}"})
 
+            # Rate limits are bucketed per user for user tokens and per client for app tokens...
+            if token == self._app_token:
+                route.bucket = "app"
+            else:
+                route.bucket = token_bucket_key(token) if isinstance(old, str) else old["user_id"]
+
         try:
-            data: RawResponse | str | None = await super().request(route)
+            data: RawResponse | str | None = await super()._send(route, deadline=deadline)
         except HTTPException as e:
             if not old or e.status != 401:
                 raise e
@@ -213,10 +326,10 @@ class ManagedHTTPClient(OAuth):
 
             if isinstance(old, str) and self.client_secret:
                 payload: ClientCredentialsPayload = await self.client_credentials_token()
-                self._app_token = payload.access_token
+                self._set_app_token(payload.access_token, expires_in=payload.expires_in)
                 route.update_headers({"Authorization": f"Bearer {payload.access_token}"})
 
-                return await self.request(route)
+                return await self._send(route, deadline=deadline)
 
             if isinstance(old, str):
                 # Will be a DCF token...
@@ -224,20 +337,17 @@ class ManagedHTTPClient(OAuth):
                 vals = list(self._tokens.values())
                 old = vals[0]
 
-            logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', old["user_id"])
-            refresh: RefreshTokenPayload = await self.__isolated.refresh_token(old["refresh"])
-            logger.debug('Token for "%s" was successfully refreshed.', old["user_id"])
+            current: TokenMappingData | None = self._tokens.get(old["user_id"])
 
-            self._tokens[old["user_id"]] = {
-                "user_id": old["user_id"],
-                "token": refresh.access_token,
-                "refresh": refresh.refresh_token,
-                "last_validated": datetime.datetime.now().isoformat(),
-            }
+            if current and current["token"] != old["token"]:
+                # Another request refreshed the token while this request was in flight...
+                new: TokenMappingData = current
+            else:
+                logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', old["user_id"])
+                new = await self._refresh(old["user_id"], old["refresh"])
 
-            self._dispatch_event(old["user_id"], refresh)
-            route.update_headers({"Authorization": f"Bearer {refresh.access_token}"})
-            return await self.request(route)
+            route.update_headers({"Authorization": f"Bearer {new['token']}"})
+            return await self._send(route, deadline=deadline)
 
         return data
 
@@ -258,75 +368,303 @@ class ManagedHTTPClient(OAuth):
         )
         return iterator
 
+    async def _refresh(self, user_id: str, refresh: str) -> TokenMappingData:
+        # Refresh tokens are rotated when used, so only a single refresh per user may be in flight at once...
+        if user_id in self._refreshing:
+            logger.debug('Waiting for the refresh of the token for "%s" already in flight.', user_id)
+
+        return await self._refreshing.run(user_id, lambda: self._do_refresh(user_id, refresh))
+
+    async def _do_refresh(self, user_id: str, refresh: str) -> TokenMappingData:
+        if self._store is None or not self._store.shared:
+            return await self._refresh_with(user_id, refresh)
+
+        # Other processes sharing the store may refresh the same token, which rotates the refresh token...
+        async with self._store.lock(user_id):
+            stored: TokenMappingData | None = await self._store.get(user_id)
+
+            if stored and stored["refresh"] != refresh:
+                logger.debug('Token for "%s" was already refreshed by another process.', user_id)
+                return self._apply_stored(stored)
+
+            data: TokenMappingData = await self._refresh_with(user_id, refresh)
+
+            # Written while the lock is held so other processes waiting to refresh see the new token...
+            self._store_dirty.discard(user_id)
+            await self._store.write({user_id: data.copy()})
+
+        return data
+
+    async def _refresh_with(self, user_id: str, refresh: str) -> TokenMappingData:
+        resp: RefreshTokenPayload = await self.__isolated.refresh_token(refresh)
+        logger.debug('Token for "%s" was successfully refreshed.', user_id)
+
+        data: TokenMappingData = self._set_token(
+            user_id,
+            resp.access_token,
+            resp.refresh_token,
+            scopes=resp.scope,
+            expires_in=resp.expires_in,
+        )
+        self._dispatch_event(user_id, resp)
+
+        return data
+
+    def _apply_stored(self, stored: TokenMappingData) -> TokenMappingData:
+        user_id: str = stored["user_id"]
+        elapsed: float | None = self._validated_ago(stored)
+        scopes: Scopes | None = self._scopes.get(user_id)
+
+        if "scopes" in stored:
+            scopes = Scopes(stored["scopes"])
+
+        data: TokenMappingData = self._set_token(
+            user_id,
+            stored["token"],
+            stored["refresh"],
+            scopes=scopes or (),
+            last_validated=stored["last_validated"],
+            elapsed=elapsed if elapsed and elapsed > 0 else 0.0,
+        )
+
+        # Tokens are unchanged, so there is no need to write them back to the store...
+        self._store_dirty.discard(user_id)
+        return data
+
+    async def __poll_store(self) -> None:
+        assert self._store is not None
+
+        while True:
+            await asyncio.sleep(self._store.poll_interval)
+
+            try:
+                changed: Mapping[str, TokenMappingData | None] = await self._store.changes()
+            except Exception as e:
+                logger.debug("Unable to check %r for changed tokens: %s", self._store, e)
+                continue
+
+            for user_id, stored in changed.items():
+                current: TokenMappingData | None = self._tokens.get(user_id)
+
+                if stored is None:
+                    if current:
+                        logger.debug('Token for "%s" was removed by another process.', user_id)
+                        self.remove_token(user_id)
+                        self._store_dirty.discard(user_id)
+
+                    continue
+
+                if not current or current["token"] != stored["token"]:
+                    logger.debug('Token for "%s" was changed by another process.', user_id)
+                    self._apply_stored(stored)
+
     async def _refresh_token(self, user_id: str, refresh: str) -> None:
         try:
-            resp: RefreshTokenPayload = await self.__isolated.refresh_token(refresh)
+            await self._refresh(user_id, refresh)
         except HTTPException as e:
             if e.status >= 500:
                 raise
 
-            self._tokens.pop(user_id, None)
+            self.remove_token(user_id)
             logger.warning('Token for "%s" was invalid and could not be refreshed.', user_id)
+
+    def _schedule_validation(
+        self,
+        user_id: str,
+        token: str,
+        expires_in: int | None = None,
+        *,
+        elapsed: float = 0.0,
+    ) -> None:
+        # Jitter spreads out validation of tokens which were added at the same time, E.g. when loaded...
+        now: float = time.monotonic()
+        jitter: float = random.uniform(0, self._validation_jitter)
+
+        # Tokens must be validated hourly...
+        due: float = now + max(self.VALIDATE_INTERVAL - elapsed - jitter, 0)
+
+        if expires_in is None:
+            self._refresh_at.pop(user_id, None)
         else:
-            logger.debug('Token for "%s" was successfully refreshed.', user_id)
+            # Tokens are refreshed ahead of expiry, so requests never have to wait on a refresh after a 401...
+            refresh_at: float = now + max(expires_in - self.REFRESH_THRESHOLD - jitter, 0)
+            self._refresh_at[user_id] = refresh_at
+            due = min(due, refresh_at)
 
-            self._tokens[user_id] = {
-                "user_id": user_id,
-                "token": resp.access_token,
-                "refresh": resp.refresh_token,
-                "last_validated": datetime.datetime.now().isoformat(),
-            }
+        self._schedule_validation_at(user_id, token, due)
 
-            self._dispatch_event(user_id, resp)
+    def _schedule_validation_at(self, user_id: str, token: str, due: float) -> None:
+        self._validation_due[user_id] = due
+        heapq.heappush(self._validation_queue, (due, user_id, token))
 
-    async def _revalidate_all(self) -> None:
-        logger.debug("Attempting to revalidate all tokens that have passed the timeout on %r.", self)
+        if self._validation_queue[0][0] == due:
+            self._validation_wakeup.set()
 
-        for data in self._tokens.copy().values():
-            user_id: str = data["user_id"]
-            token: str = data["token"]
-            refresh: str = data["refresh"]
+    async def _revalidate(self, user_id: str, token: str) -> None:
+        data: TokenMappingData | None = self._tokens.get(user_id)
+        if not data or data["token"] != token:
+            return
 
-            last_validated: datetime.datetime = datetime.datetime.fromisoformat(data["last_validated"])
-            if last_validated + datetime.timedelta(minutes=55) > datetime.datetime.now():
-                continue
+        if time.monotonic() >= self._refresh_at.get(user_id, math.inf):
+            logger.debug('Token for "%s" is close to expiring. Refreshing token ahead of expiry.', user_id)
+            await self._refresh_token(user_id, data["refresh"])
+            return
 
-            try:
-                valid_resp: ValidateTokenPayload = await self.__isolated.validate_token(token)
-            except HTTPException as e:
-                if e.status >= 500:
-                    raise
+        try:
+            valid_resp: ValidateTokenPayload = await self.__isolated.validate_token(token)
+        except HTTPException as e:
+            if e.status >= 500:
+                raise
 
-                logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', user_id)
-                await self._refresh_token(user_id, refresh)
-            else:
-                if valid_resp.expires_in <= 3600:
-                    logger.debug(
-                        'Token for "%s" expires in %s seconds. Attempting to refresh token.', user_id, valid_resp.expires_in
-                    )
+            logger.debug('Token for "%s" was invalid or expired. Attempting to refresh token.', user_id)
+            await self._refresh_token(user_id, data["refresh"])
+            return
 
-                    await self._refresh_token(user_id, refresh)
-                    continue
+        if valid_resp.expires_in <= self.REFRESH_THRESHOLD:
+            logger.debug(
+                'Token for "%s" expires in %s seconds. Attempting to refresh token.', user_id, valid_resp.expires_in
+            )
+            await self._refresh_token(user_id, data["refresh"])
+            return
 
-                self._tokens[user_id]["last_validated"] = datetime.datetime.now().isoformat()
+        data["last_validated"] = datetime.datetime.now().isoformat()
+        self._scopes[user_id] = scopes = Scopes(valid_resp.scopes)
+        data["scopes"] = scopes.selected
+        self._schedule_validation(user_id, token, valid_resp.expires_in)
+        self._mark_dirty(user_id)
+
+    async def _run_validation(self, user_id: str, token: str) -> None:
+        async with self._validation_semaphore:
+            try:
+                await self._revalidate(user_id, token)
+            except (ConnectionError, aiohttp.ClientConnectorError, HTTPException) as e:
+                wait: float = self._backoff.calculate()
+                logger.debug('Unable to reach Twitch to revalidate token for "%s": %s. Retrying in %ss', user_id, e, wait)
+
+                self._schedule_validation_at(user_id, token, time.monotonic() + wait)
+            except Exception as e:
+                # Any other error must not stop validation of this token, or end the validation loop...
+                wait: float = self._backoff.calculate()
+                logger.warning('Unexpected error revalidating token for "%s". Retrying in %ss', user_id, wait, exc_info=e)
+
+                self._schedule_validation_at(user_id, token, time.monotonic() + wait)
 
     async def __validate_loop(self) -> None:
         logger.debug("Started the token validation loop on %r.", self)
 
         while True:
-            try:
-                await self._revalidate_all()
-            except (ConnectionError, aiohttp.ClientConnectorError, HTTPException) as e:
-                wait: float = self._backoff.calculate()
-                logger.debug("Unable to reach Twitch to revalidate tokens: %s. Retrying in %s's", e, wait)
+            now: float = time.monotonic()
+            due: list[tuple[str, str]] = []
 
-                await asyncio.sleep(wait)
+            while self._validation_queue and self._validation_queue[0][0] <= now:
+                when, user_id, token = heapq.heappop(self._validation_queue)
+
+                # Entries are superseded when a token is rescheduled, refreshed or removed...
+                if self._validation_due.get(user_id) != when:
+                    continue
+
+                del self._validation_due[user_id]
+                due.append((user_id, token))
+
+            if due:
+                logger.debug("Revalidating %d tokens on %r.", len(due), self)
+                await asyncio.gather(
+                    *(self._run_validation(user_id, token) for user_id, token in due), return_exceptions=True
+                )
                 continue
 
-            await asyncio.sleep(60)
+            timeout: float | None = self._validation_queue[0][0] - now if self._validation_queue else None
+            self._validation_wakeup.clear()
+
+            try:
+                await asyncio.wait_for(self._validation_wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
 
     def cleanup(self) -> None:
+        for user_id in self._tokens:
+            self._ratelimiter.untrack(user_id)
+
         self._tokens.clear()
+        self._token_index.clear()
+        self._scopes.clear()
+        self._validation_queue.clear()
+        self._validation_due.clear()
+        self._refresh_at.clear()
+
+    def _set_app_token(self, token: str | None, *, expires_in: int | None = None) -> None:
+        self._app_token = token
+
+        if self._app_refresh_task:
+            self._app_refresh_task.cancel()
+            self._app_refresh_task = None
+
+        if token and expires_in is not None and self.client_secret:
+            self._app_refresh_task = asyncio.create_task(self.__refresh_app_token(expires_in))
+
+    async def __refresh_app_token(self, expires_in: int) -> None:
+        while True:
+            delay: float = expires_in - self.REFRESH_THRESHOLD - random.uniform(0, self._validation_jitter)
+            await asyncio.sleep(max(delay, 0))
+
+            while True:
+                try:
+                    payload: ClientCredentialsPayload = await self.client_credentials_token()
+                except (ConnectionError, aiohttp.ClientConnectorError, HTTPException) as e:
+                    wait: float = self._backoff.calculate()
+                    logger.debug("Unable to refresh the app token ahead of expiry: %s. Retrying in %ss", e, wait)
+
+                    await asyncio.sleep(wait)
+                    continue
+
+                break
+
+            logger.debug("App token was refreshed ahead of expiry.")
+            self._app_token = payload.access_token
+            expires_in = payload.expires_in
+
+    def _start_tasks(self) -> None:
+        if not self._validate_task:
+            self._validate_task = asyncio.create_task(self.__validate_loop())
+
+        if not self._poll_task and self._store is not None and self._store.shared:
+            self._poll_task = asyncio.create_task(self.__poll_store())
+
+    def _mark_dirty(self, user_id: str) -> None:
+        if self._store is None:
+            return
+
+        self._store_dirty.add(user_id)
+        if self._store_task is None:
+            self._store_task = asyncio.create_task(self._write_store())
+
+    async def _write_store(self) -> None:
+        assert self._store is not None
+
+        try:
+            while self._store_dirty:
+                dirty, self._store_dirty = self._store_dirty, set()
+                changes: dict[str, TokenMappingData | None] = {}
+
+                for user_id in dirty:
+                    data: TokenMappingData | None = self._tokens.get(user_id)
+                    changes[user_id] = data.copy() if data else None
+
+                try:
+                    await self._store.write(changes)
+                except Exception as e:
+                    self._store_dirty |= dirty
+                    logger.warning("Unable to write %d changed tokens to %r: %s", len(changes), self._store, e)
+                    return
+        finally:
+            self._store_task = None
+
+    async def _flush_store(self) -> None:
+        if self._store_task is None and self._store_dirty:
+            self._store_task = asyncio.create_task(self._write_store())
+
+        if self._store_task is not None:
+            await self._store_task
 
     async def close(self) -> None:
         if self._validate_task:
@@ -337,40 +675,91 @@ class ManagedHTTPClient(OAuth):
 
             self._validate_task = None
 
-        await super().close()
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+        if self._app_refresh_task:
+            self._app_refresh_task.cancel()
+            self._app_refresh_task = None
+
+        if self._store is not None:
+            await self._flush_store()
+            await self._store.close()
+
         await self.__isolated.close()
+        await super().close()
 
     async def save(self, name: str | None = None) -> None:
+        if self._store is not None:
+            await self._flush_store()
+            return
+
         if not self._has_loaded:
             return
 
         name = name or ".tio.tokens.json"
-
-        with open(name, "w+", encoding="UTF-8") as fp:
-            json.dump(self._tokens, fp)
+        await asyncio.to_thread(write_tokens, pathlib.Path(name), {k: v.copy() for k, v in self._tokens.items()})
 
         logger.info('%s tokens from %r have been saved to: "%s".', len(self._tokens), self, name)
 
+    @staticmethod
+    def _read_tokens(name: str) -> TokenMapping:
+        try:
+            with open(name, encoding="UTF-8") as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    @staticmethod
+    def _validated_ago(data: TokenMappingData) -> float | None:
+        try:
+            validated: datetime.datetime = datetime.datetime.fromisoformat(data["last_validated"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+        return (datetime.datetime.now() - validated).total_seconds()
+
+    async def _load_token(self, data: TokenMappingData) -> None:
+        if self._defer_validation:
+            elapsed: float | None = self._validated_ago(data)
+
+            # Recently validated tokens are added as is and validated by the scheduler once due...
+            if elapsed is not None and 0 <= elapsed < self.VALIDATE_INTERVAL:
+                self._apply_stored(data)
+                return
+
+        async with self._validation_semaphore:
+            await self.add_token(token=data["token"], refresh=data["refresh"])
+
     async def load_tokens(self, name: str | None = None) -> None:
         name = name or ".tio.tokens.json"
-        data: dict[str, Any] = {}
+
+        if self._store is not None:
+            data: TokenMapping = await self._store.load()
+        else:
+            data = await asyncio.to_thread(self._read_tokens, name)
+
         failed: list[str] = []
-        loaded: int = 0
 
-        try:
-            with open(name, "r+", encoding="UTF-8") as fp:
-                data = json.load(fp)
-        except FileNotFoundError:
-            pass
+        self._start_tasks()
 
-        for key, value in data.items():
-            try:
-                await self.add_token(token=value["token"], refresh=value["refresh"])
-                loaded += 1
-            except InvalidTokenException:
+        # A single failing token must not cancel the others, so errors are collected and the first is raised after...
+        results: list[BaseException | None] = await asyncio.gather(
+            *(self._load_token(value) for value in data.values()), return_exceptions=True
+        )
+        error: BaseException | None = None
+
+        for key, result in zip(data, results):
+            if isinstance(result, InvalidTokenException):
                 failed.append(key)
+            elif result is not None and error is None:
+                error = result
+
+        if error is not None:
+            raise error
 
-        logger.info("Loaded %s tokens into %r.", loaded, self)
+        logger.info("Loaded %s tokens into %r.", len(data) - len(failed), self)
         if failed:
             msg: str = f"The following users tokens failed to load: {', '.join(failed)}"
             logger.warning(msg)
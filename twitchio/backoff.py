@@ -25,11 +25,22 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import random
+import time
 from typing import TYPE_CHECKING
 
+import aiohttp
+
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Mapping
+
+    from .http import Route
+
+
+__all__ = ("Backoff", "RetryPolicy")
+
+
+IDEMPOTENT_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
 
 
 class Backoff:
@@ -79,3 +90,131 @@ class Backoff:
         self._retries += 1
 
         return wait
+
+
+class RetryPolicy:
+    """A policy used by TwitchIO to retry failed HTTP requests to Twitch.
+
+    Requests are retried with a jittered exponential :class:`Backoff` between attempts. Requests which fail with status
+    ``429`` are retried when the rate limit resets, as reported by the ``Ratelimit-Reset`` header.
+
+    ``429`` and ``503`` responses and failures to connect to Twitch are retried for every request method, as Twitch did not
+    process the request. Other statuses and lost connections are only retried for idempotent methods
+    (``GET``, ``HEAD``, ``OPTIONS``, ``PUT`` and ``DELETE``) unless ``idempotent_only`` is ``False``.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    max_attempts: int
+        The maximum amount of times a request will be attempted, including the first attempt. Defaults to ``3``.
+        Setting this to ``1`` disables retries.
+    statuses: Iterable[int]
+        The HTTP status codes which should be retried. Defaults to ``429``, ``500``, ``502``, ``503`` and ``504``.
+    base: int
+        The base time passed to the :class:`Backoff`. Defaults to ``1``.
+    maximum_time: float
+        The maximum time in seconds to wait between attempts. Defaults to ``30.0``.
+    retry_connection_errors: bool
+        Whether connection errors raised by ``aiohttp`` should be retried. Defaults to ``True``.
+    idempotent_only: bool
+        Whether statuses other than ``429`` and ``503`` and lost connections should only be retried for idempotent
+        request methods. Defaults to ``True``.
+    overrides: Mapping[str, RetryPolicy] | None
+        An optional mapping of API endpoint paths, E.g. ``"chat/messages"``, to a :class:`RetryPolicy` which should be
+        used for requests to that endpoint instead of this policy.
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        # Retry up to 5 times, but never retry sending chat messages...
+        policy = twitchio.RetryPolicy(max_attempts=5, overrides={"chat/messages": twitchio.RetryPolicy(max_attempts=1)})
+        client = twitchio.Client(..., retry_policy=policy)
+    """
+
+    __slots__ = (
+        "base",
+        "idempotent_only",
+        "max_attempts",
+        "maximum_time",
+        "overrides",
+        "retry_connection_errors",
+        "statuses",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        base: int = 1,
+        maximum_time: float = 30.0,
+        retry_connection_errors: bool = True,
+        idempotent_only: bool = True,
+        overrides: Mapping[str, RetryPolicy] | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('"max_attempts" must be greater than or equal to 1.')
+
+        self.max_attempts: int = max_attempts
+        self.statuses: frozenset[int] = frozenset(statuses)
+        self.base: int = base
+        self.maximum_time: float = maximum_time
+        self.retry_connection_errors: bool = retry_connection_errors
+        self.idempotent_only: bool = idempotent_only
+        self.overrides: dict[str, RetryPolicy] = {k.strip("/"): v for k, v in (overrides or {}).items()}
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy(max_attempts={self.max_attempts}, statuses={sorted(self.statuses)})"
+
+    def for_route(self, route: Route) -> RetryPolicy:
+        """Return the :class:`RetryPolicy` which should be used for the provided :class:`~twitchio.Route`."""
+        return self.overrides.get(route.path, self)
+
+    def backoff(self) -> Backoff:
+        """Return a new :class:`Backoff` used to calculate the wait between attempts of a single request."""
+        return Backoff(base=self.base, maximum_time=self.maximum_time, maximum_tries=None)
+
+    def should_retry(self, route: Route, attempt: int, *, status: int | None = None, error: Exception | None = None) -> bool:
+        """Return whether a failed request should be attempted again.
+
+        Parameters
+        ----------
+        route: :class:`~twitchio.Route`
+            The route of the failed request.
+        attempt: int
+            The amount of times the request has been attempted so far.
+        status: int | None
+            The status code of the failed response. ``None`` when the request failed with ``error``.
+        error: Exception | None
+            The exception raised while making the request. ``None`` when a response was received.
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        idempotent: bool = not self.idempotent_only or route.method in IDEMPOTENT_METHODS
+
+        if error is not None:
+            if not self.retry_connection_errors:
+                return False
+
+            # Twitch never received the request when we could not connect...
+            return isinstance(error, aiohttp.ClientConnectorError) or idempotent
+
+        if status not in self.statuses:
+            return False
+
+        return status in (429, 503) or idempotent
+
+    def delay(self, backoff: Backoff, *, status: int | None = None, reset: float | None = None) -> float:
+        """Return the time in seconds to wait before the next attempt.
+
+        For ``429`` responses this is the time until ``reset``, with a small amount of jitter to avoid waiters
+        retrying in lockstep.
+        """
+        if status == 429 and reset:
+            return min(max(reset - time.time(), 0.0) + random.uniform(0, 0.25), self.maximum_time)
+
+        return backoff.calculate()
@@ -0,0 +1,643 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import pathlib
+import re
+import secrets
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple
+
+from .utils import MISSING, SingleFlight
+
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import AsyncIterator, Iterable, Mapping
+
+    from .assets import Asset
+    from .http import Route
+
+
+__all__ = ("AssetCache", "ResponseCache")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _CacheEntry(NamedTuple):
+    path: str
+    expires: float
+    size: int
+    data: Any
+
+
+class ResponseCache:
+    """A TTL and LRU bounded cache for responses from slow-changing Twitch API endpoints.
+
+    Only successful ``GET`` requests to endpoints with a configured TTL are cached. Entries are keyed by the full request
+    URL, including query parameters, and the least recently used entries are evicted when either ``max_entries`` or
+    ``max_bytes`` is exceeded.
+
+    Pass an instance of this class to :class:`~twitchio.Client` with the ``response_cache`` parameter to enable caching.
+
+    .. versionadded:: 3.3
+
+    .. note::
+
+        Cached responses are shared between every caller and should not be mutated.
+
+    Parameters
+    ----------
+    ttls: Mapping[str, float] | None
+        An optional mapping of API endpoint paths, E.g. ``"chat/badges/global"``, to the time in seconds responses should be
+        cached for. These are merged with and override :attr:`DEFAULT_TTLS`. Set a TTL to ``0`` to disable caching for an
+        endpoint.
+    max_entries: int
+        The maximum amount of responses to keep in the cache. Defaults to ``1024``.
+    max_bytes: int
+        The maximum total size of the cached response bodies in bytes. Defaults to ``16 MiB``.
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        cache = twitchio.ResponseCache(ttls={"games": 600})
+        client = twitchio.Client(..., response_cache=cache)
+
+        # Later...
+        cache.invalidate("chat/emotes")
+        print(cache.stats())
+    """
+
+    DEFAULT_TTLS: ClassVar[dict[str, float]] = {
+        "bits/cheermotes": 3600.0,
+        "chat/badges": 600.0,
+        "chat/badges/global": 3600.0,
+        "chat/emotes": 600.0,
+        "chat/emotes/global": 3600.0,
+        "content_classification_labels": 86400.0,
+        "games": 3600.0,
+    }
+
+    __slots__ = ("_entries", "_size", "evictions", "hits", "max_bytes", "max_entries", "misses", "ttls")
+
+    def __init__(
+        self,
+        *,
+        ttls: Mapping[str, float] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.ttls: dict[str, float] = {**self.DEFAULT_TTLS, **{k.strip("/"): v for k, v in (ttls or {}).items()}}
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._size: int = 0
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(entries={len(self._entries)}, size={self._size}, hits={self.hits}, misses={self.misses})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached response bodies in bytes."""
+        return self._size
+
+    def cacheable(self, route: Route) -> bool:
+        """Return whether responses for the provided :class:`~twitchio.Route` can be cached."""
+        return route.method == "GET" and self.ttls.get(route.path, 0) > 0
+
+    def get(self, route: Route) -> Any:
+        """Return the cached response for the provided :class:`~twitchio.Route` or ``MISSING``."""
+        entry: _CacheEntry | None = self._entries.get(route.url)
+
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        if entry.expires <= time.monotonic():
+            self._remove(route.url)
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(route.url)
+        self.hits += 1
+
+        return entry.data
+
+    def set(self, route: Route, data: Any, *, size: int) -> None:
+        """Cache the response for the provided :class:`~twitchio.Route`.
+
+        Responses larger than ``max_bytes`` are not cached.
+        """
+        ttl: float = self.ttls.get(route.path, 0)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        self._remove(route.url)
+        self._entries[route.url] = _CacheEntry(route.path, time.monotonic() + ttl, size, data)
+        self._size += size
+
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+            self.evictions += 1
+
+    def _remove(self, url: str) -> None:
+        entry: _CacheEntry | None = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def invalidate(self, path: str | None = None) -> int:
+        """Remove cached responses.
+
+        Parameters
+        ----------
+        path: str | None
+            An optional API endpoint path, E.g. ``"chat/emotes"``, to remove all cached responses for.
+            If ``None``, the whole cache is cleared. Defaults to ``None``.
+
+        Returns
+        -------
+        int
+            The amount of cached responses removed.
+        """
+        if path is None:
+            removed: int = len(self._entries)
+            self._entries.clear()
+            self._size = 0
+
+            return removed
+
+        path = path.strip("/")
+        urls: list[str] = [url for url, entry in self._entries.items() if entry.path == path]
+
+        for url in urls:
+            self._remove(url)
+
+        return len(urls)
+
+    def stats(self) -> dict[str, int]:
+        """Return a :class:`dict` of the cache counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
+
+
+class _AssetEntry(NamedTuple):
+    digest: str
+    size: int
+    ext: str | None
+
+
+class AssetCache:
+    """A size bounded, content-addressed cache of :class:`~twitchio.Asset`'s on disk.
+
+    Assets are stored in ``directory`` in files named by the SHA-256 hash of their content, so identical images served from
+    different URLs are only stored once. Entries are keyed by the URL of the asset and the least recently used entries are
+    evicted when the total size of the stored files exceeds ``max_bytes``. The index of URLs is kept in ``directory`` and
+    persists between runs.
+
+    When passed to :class:`~twitchio.Client` with the ``asset_cache`` parameter, :meth:`Asset.read() <twitchio.Asset.read>`,
+    :meth:`Asset.save() <twitchio.Asset.save>` and :meth:`Asset.fetch_ext() <twitchio.Asset.fetch_ext>` use the cache
+    instead of downloading the asset again.
+
+    Downloads are shared between concurrent callers requesting the same URL, and at most ``concurrency`` downloads are made
+    at once.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    directory: str | os.PathLike[str]
+        The directory to store cached assets in. It is created if it does not exist. Other files in this directory are left
+        untouched, but a dedicated directory is recommended.
+    max_bytes: int
+        The maximum total size of the cached assets in bytes. Defaults to ``256 MiB``.
+    concurrency: int
+        The maximum amount of assets downloaded at once. Defaults to ``8``.
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        cache = twitchio.AssetCache(".tio.assets")
+        client = twitchio.Client(..., asset_cache=cache)
+
+        # Later...
+        badges = await client.fetch_global_badges()
+        await cache.prefetch(version.get_image() for badge in badges for version in badge.versions)
+    """
+
+    INDEX: ClassVar[str] = "index.json"
+    # Only files matching this are created by the cache; other files in the directory are never removed...
+    FILES: ClassVar[re.Pattern[str]] = re.compile(r"[0-9a-f]{64}|\.[0-9a-f]+\.part|\.index\.json\.[0-9a-f]+")
+
+    __slots__ = (
+        "_blobs",
+        "_entries",
+        "_inflight",
+        "_load_lock",
+        "_loaded",
+        "_save_task",
+        "_semaphore",
+        "_size",
+        "concurrency",
+        "directory",
+        "evictions",
+        "hits",
+        "max_bytes",
+        "misses",
+    )
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        concurrency: int = 8,
+    ) -> None:
+        self.directory: pathlib.Path = pathlib.Path(directory)
+        self.max_bytes: int = max_bytes
+        self.concurrency: int = concurrency
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._entries: OrderedDict[str, _AssetEntry] = OrderedDict()
+        self._blobs: dict[str, int] = {}
+        self._size: int = 0
+
+        self._loaded: bool = False
+        self._load_lock: asyncio.Lock = asyncio.Lock()
+        self._inflight: SingleFlight[str, _AssetEntry] = SingleFlight()
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+        self._save_task: asyncio.Task[None] | None = None
+
+    def __repr__(self) -> str:
+        return f"AssetCache(directory={self.directory}, entries={len(self._entries)}, size={self._size})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached assets in bytes."""
+        return self._size
+
+    def _path(self, digest: str) -> pathlib.Path:
+        return self.directory / digest
+
+    async def _load(self) -> None:
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            entries: list[tuple[str, _AssetEntry]] = await asyncio.to_thread(self._read_index)
+
+            for url, entry in entries:
+                self._add(url, entry)
+
+            self._loaded = True
+            logger.debug("Loaded %d cached assets from %s.", len(entries), self.directory)
+
+        await self._evict()
+
+    def _read_index(self) -> list[tuple[str, _AssetEntry]]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with open(self.directory / self.INDEX, encoding="UTF-8") as fp:
+                data: list[list[Any]] = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            data = []
+
+        files: set[str] = {path.name for path in self.directory.iterdir() if path.is_file()}
+        entries: list[tuple[str, _AssetEntry]] = [(url, _AssetEntry(*rest)) for url, *rest in data if rest[0] in files]
+
+        # Remove files which are no longer referenced, E.g. after the index was lost or an interrupted download...
+        referenced: set[str] = {entry.digest for _, entry in entries}
+        for name in files - referenced:
+            if self.FILES.fullmatch(name):
+                (self.directory / name).unlink(missing_ok=True)
+
+        return entries
+
+    def _write_index(self, data: list[list[Any]]) -> None:
+        # Written to a temporary file and renamed so an interrupted write does not lose the index...
+        tmp: pathlib.Path = self.directory / f".{self.INDEX}.{secrets.token_hex(4)}"
+
+        with open(tmp, "w", encoding="UTF-8") as fp:
+            json.dump(data, fp)
+
+        tmp.replace(self.directory / self.INDEX)
+
+    def _schedule_save(self) -> None:
+        if self._save_task is None:
+            self._save_task = asyncio.create_task(self._save_later())
+
+    async def _save_later(self) -> None:
+        # Saves are batched, as many assets are usually added at once...
+        await asyncio.sleep(1.0)
+        self._save_task = None
+
+        await self._save()
+
+    async def _save(self) -> None:
+        data: list[list[Any]] = [[url, *entry] for url, entry in self._entries.items()]
+        await asyncio.to_thread(self._write_index, data)
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Write the index of cached assets to disk immediately.
+
+        The index is otherwise written shortly after assets are added or removed.
+        """
+        if self._save_task is not None:
+            self._save_task.cancel()
+            self._save_task = None
+
+        if self._loaded:
+            await self._save()
+
+    def _add(self, url: str, entry: _AssetEntry) -> None:
+        self._discard(url)
+        self._entries[url] = entry
+
+        refs: int = self._blobs.get(entry.digest, 0)
+        self._blobs[entry.digest] = refs + 1
+
+        if not refs:
+            self._size += entry.size
+
+    def _discard(self, url: str) -> str | None:
+        entry: _AssetEntry | None = self._entries.pop(url, None)
+        if entry is None:
+            return None
+
+        refs: int = self._blobs[entry.digest] - 1
+        if refs:
+            self._blobs[entry.digest] = refs
+            return None
+
+        # The file is no longer referenced by any URL...
+        del self._blobs[entry.digest]
+        self._size -= entry.size
+
+        return entry.digest
+
+    async def _evict(self) -> None:
+        removed: list[str] = []
+
+        # The most recently added entry is always kept, even when it is larger than max_bytes...
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            url: str = next(iter(self._entries))
+            digest: str | None = self._discard(url)
+            self.evictions += 1
+
+            if digest:
+                removed.append(digest)
+
+        if removed:
+            await asyncio.to_thread(self._unlink, removed)
+            self._schedule_save()
+
+    def _unlink(self, digests: list[str]) -> None:
+        for digest in digests:
+            self._path(digest).unlink(missing_ok=True)
+
+    def _lookup(self, asset: Asset) -> _AssetEntry | None:
+        entry: _AssetEntry | None = self._entries.get(asset.url)
+
+        if entry is not None:
+            self._entries.move_to_end(asset.url)
+
+            if entry.ext and not asset._ext:
+                asset._ext = entry.ext
+
+        return entry
+
+    async def get(self, asset: Asset) -> pathlib.Path | None:
+        """|coro|
+
+        Return the path of the cached file for the provided :class:`~twitchio.Asset`, or ``None`` if it is not cached.
+
+        This does not download the asset.
+        """
+        await self._load()
+
+        entry: _AssetEntry | None = self._lookup(asset)
+        return self._path(entry.digest) if entry else None
+
+    async def fetch(self, asset: Asset) -> pathlib.Path:
+        """|coro|
+
+        Return the path of the cached file for the provided :class:`~twitchio.Asset`, downloading it if it is not cached.
+
+        Raises
+        ------
+        HTTPException
+            The asset could not be downloaded.
+        """
+        await self._load()
+
+        entry: _AssetEntry | None = self._lookup(asset)
+        if entry is not None:
+            self.hits += 1
+            return self._path(entry.digest)
+
+        self.misses += 1
+        downloaded: _AssetEntry = await self._inflight.run(asset.url, lambda: self._download(asset))
+        return self._path(downloaded.digest)
+
+    async def _download(self, asset: Asset) -> _AssetEntry:
+        async with self._semaphore:
+            tmp: pathlib.Path = self.directory / f".{secrets.token_hex(8)}.part"
+            hasher = hashlib.sha256()
+            size: int = 0
+
+            def write(chunk: bytes) -> None:
+                hasher.update(chunk)
+                fp.write(chunk)
+
+            fp = await asyncio.to_thread(open, tmp, "wb")
+            try:
+                async for chunk in asset._http._request_asset(asset):
+                    await asyncio.to_thread(write, chunk)
+                    size += len(chunk)
+            except BaseException:
+                await asyncio.to_thread(fp.close)
+                await asyncio.to_thread(tmp.unlink, missing_ok=True)
+                raise
+
+            digest: str = hasher.hexdigest()
+            await asyncio.to_thread(fp.close)
+            await asyncio.to_thread(tmp.replace, self._path(digest))
+
+        entry: _AssetEntry = _AssetEntry(digest, size, asset._ext)
+        self._add(asset.url, entry)
+
+        logger.debug("Cached asset %r as %s (%d bytes).", asset, digest, size)
+
+        await self._evict()
+        self._schedule_save()
+
+        return entry
+
+    async def stream(self, asset: Asset, *, chunk_size: int = 65536, offset: int = 0) -> AsyncIterator[bytes]:
+        """Yield the content of the provided :class:`~twitchio.Asset` in chunks, downloading it if it is not cached.
+
+        Parameters
+        ----------
+        asset: :class:`~twitchio.Asset`
+            The asset to read.
+        chunk_size: int
+            The size of the chunks to read. Defaults to ``65536``.
+        offset: int
+            The position in the asset to start reading from. Defaults to ``0``.
+        """
+        path: pathlib.Path = await self.fetch(asset)
+
+        try:
+            fp = await asyncio.to_thread(open, path, "rb")
+        except FileNotFoundError:
+            # The file was removed outside of the cache; download it again...
+            self._discard(asset.url)
+            fp = await asyncio.to_thread(open, await self.fetch(asset), "rb")
+
+        try:
+            if offset:
+                await asyncio.to_thread(fp.seek, offset)
+
+            while chunk := await asyncio.to_thread(fp.read, chunk_size):
+                yield chunk
+        finally:
+            await asyncio.to_thread(fp.close)
+
+    async def prefetch(self, assets: Iterable[Asset], *, ignore_errors: bool = False) -> list[pathlib.Path | None]:
+        """|coro|
+
+        Download and cache multiple :class:`~twitchio.Asset`'s concurrently, with at most :attr:`concurrency` downloads at
+        once. Assets which are already cached are not downloaded again.
+
+        Parameters
+        ----------
+        assets: Iterable[:class:`~twitchio.Asset`]
+            The assets to cache, E.g. the images of every emote in a set.
+        ignore_errors: bool
+            Whether assets which fail to download should be ``None`` in the returned list instead of raising. Defaults to
+            ``False``.
+
+        Returns
+        -------
+        list[pathlib.Path | None]
+            The paths of the cached files in the same order as ``assets``.
+
+        Raises
+        ------
+        HTTPException
+            An asset could not be downloaded and ``ignore_errors`` is ``False``.
+        """
+        results: list[pathlib.Path | BaseException] = await asyncio.gather(
+            *(self.fetch(asset) for asset in assets),
+            return_exceptions=True,
+        )
+
+        paths: list[pathlib.Path | None] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                if not ignore_errors:
+                    raise result
+
+                logger.debug("Ignoring exception while prefetching assets: %s", result)
+                paths.append(None)
+            else:
+                paths.append(result)
+
+        return paths
+
+    async def invalidate(self, url: str | None = None) -> int:
+        """|coro|
+
+        Remove cached assets.
+
+        Parameters
+        ----------
+        url: str | None
+            An optional URL of an asset to remove from the cache. If ``None``, the whole cache is cleared.
+            Defaults to ``None``.
+
+        Returns
+        -------
+        int
+            The amount of cached assets removed.
+        """
+        await self._load()
+
+        urls: list[str] = list(self._entries) if url is None else [url] if url in self._entries else []
+        removed: list[str] = [digest for u in urls if (digest := self._discard(u))]
+
+        if removed:
+            await asyncio.to_thread(self._unlink, removed)
+
+        if urls:
+            self._schedule_save()
+
+        return len(urls)
+
+    def stats(self) -> dict[str, int]:
+        """Return a :class:`dict` of the cache counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "files": len(self._blobs),
+            "bytes": self._size,
+        }
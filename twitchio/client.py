@@ -37,6 +37,7 @@ from .eventsub.enums import SubscriptionType
 from .eventsub.websockets import Websocket, WebsocketClosed
 from .exceptions import HTTPException, MissingConduit
 from .http import HTTPAsyncIterator
+from .loader import HelixLoader
 from .models.bits import Cheermote, ExtensionTransaction
 from .models.ccls import ContentClassificationLabel
 from .models.channels import ChannelInfo
@@ -60,6 +61,7 @@ if TYPE_CHECKING:
     from .authentication import ClientCredentialsPayload, ValidateTokenPayload
     from .eventsub.subscriptions import SubscriptionPayload
     from .http import HTTPAsyncIterator
+    from .metrics import HTTPMetrics
     from .models.clips import Clip
     from .models.entitlements import Entitlement, EntitlementStatus
     from .models.eventsub_ import ConduitShard, EventsubSubscription, EventsubSubscriptions
@@ -124,6 +126,55 @@ class Client:
         An optional bool indicating whether to fetch and cache the client/bot accounts own :class:`.User` object to use with
         :attr:`.user`.
         Defaults to ``True``. You must pass ``bot_id`` for this parameter to have any effect.
+    retry_policy: twitchio.RetryPolicy | None
+        An optional :class:`~twitchio.RetryPolicy` used to retry failed requests to the Twitch API.
+        Defaults to a :class:`~twitchio.RetryPolicy` with default settings, which retries transient failures up to ``3``
+        times.
+    coalesce_requests: bool
+        An optional bool indicating whether identical ``GET`` requests to the Twitch API which are made while one is already
+        in flight should share the response of that request instead of making another request. Defaults to ``True``.
+
+        When enabled, the same decoded JSON object is shared with every caller and should not be mutated.
+    response_cache: twitchio.ResponseCache | None
+        An optional :class:`~twitchio.ResponseCache` used to cache responses from slow-changing Twitch API endpoints, such as
+        chat badges, emotes and games. Defaults to ``None`` which disables caching.
+    asset_cache: twitchio.AssetCache | None
+        An optional :class:`~twitchio.AssetCache` used to cache :class:`~twitchio.Asset`'s, such as emote and badge images,
+        on disk. Defaults to ``None`` which disables caching.
+    connection_pool: twitchio.ConnectionPool | None
+        An optional :class:`~twitchio.ConnectionPool` used to configure the pool of connections shared by all HTTP requests,
+        including OAuth and :class:`~twitchio.Asset`'s. Defaults to a :class:`~twitchio.ConnectionPool` with default settings.
+        Has no effect when ``session`` is provided.
+    metrics: twitchio.HTTPMetrics | None
+        An optional :class:`~twitchio.HTTPMetrics` used to record per endpoint metrics of requests made to the Twitch API.
+        Provide a subclass to export metrics elsewhere. Defaults to a :class:`~twitchio.HTTPMetrics`, see :attr:`.metrics`.
+    request_timeout: float | None
+        An optional float indicating the default time in seconds a request to the Twitch API may take, including time spent
+        waiting for the rate limit and retries, before :exc:`~twitchio.HTTPTimeoutException` is raised. Defaults to ``None``
+        which does not limit the time requests may take.
+    token_routing: bool
+        An optional bool indicating whether requests to endpoints which accept any app or user token, such as
+        :meth:`.fetch_streams` and :meth:`.fetch_users`, should be made with the managed token which has the most remaining
+        rate limit, instead of always using the app token. Requests made with an explicit ``token_for`` are unaffected.
+        Defaults to ``False``.
+    validation_concurrency: int
+        An optional int indicating the maximum amount of managed user tokens validated or refreshed at once by the background
+        validation scheduler and when loading tokens with :meth:`.load_tokens`. Defaults to ``10``.
+    validation_jitter: float
+        An optional float indicating the maximum time in seconds tokens are validated or refreshed early by, to spread out
+        validation of tokens added at the same time. Managed user tokens and generated app tokens are refreshed in the
+        background ahead of their expiry. Defaults to ``60.0``.
+    defer_validation: bool
+        An optional bool indicating whether tokens loaded with the default :meth:`.load_tokens` which were validated within
+        the last hour should be added without validating them first. These tokens are validated by the background scheduler
+        once due, making startup with many stored tokens near instant. Defaults to ``False``.
+    token_store: :class:`~twitchio.authentication.TokenStore` | None
+        An optional :class:`~twitchio.authentication.TokenStore` used by the default :meth:`.load_tokens` and
+        :meth:`.save_tokens` instead of the ``.tio.tokens.json`` file. Tokens are written to the store as soon as they are
+        added, refreshed or removed. Defaults to ``None``.
+    batch_window: float
+        An optional float indicating the time in seconds :attr:`.loader` collects lookups for before making a batched request.
+        Defaults to ``0.01``.
     """
 
     def __init__(
@@ -146,7 +197,20 @@ class Client:
             scopes=scopes,
             session=session,
             client=self,
+            retry_policy=options.get("retry_policy"),
+            coalesce_requests=options.get("coalesce_requests", True),
+            response_cache=options.get("response_cache"),
+            asset_cache=options.get("asset_cache"),
+            connection_pool=options.get("connection_pool"),
+            metrics=options.get("metrics"),
+            request_timeout=options.get("request_timeout"),
+            token_routing=options.get("token_routing", False),
+            validation_concurrency=options.get("validation_concurrency", 10),
+            validation_jitter=options.get("validation_jitter", 60.0),
+            defer_validation=options.get("defer_validation", False),
+            token_store=options.get("token_store"),
         )
+        self._loader: HelixLoader = HelixLoader(self._http, window=options.get("batch_window", 0.01))
         if not has_starlette:
             msg = "If you require the StarletteAdapter please install the required packages: 'pip install twitchio[starlette]'."
             logger.warning(msg)
@@ -202,6 +266,24 @@ class Client:
         """
         return self._http
 
+    @property
+    def loader(self) -> HelixLoader:
+        """Property returning the :class:`~twitchio.HelixLoader` used to batch concurrent lookups of users, streams, channels
+        and games into as few requests as possible.
+
+        .. versionadded:: 3.3
+        """
+        return self._loader
+
+    @property
+    def metrics(self) -> HTTPMetrics:
+        """Property returning the :class:`~twitchio.HTTPMetrics` recording the latency, status codes, retries, bytes received
+        and remaining rate limit of requests made to each Twitch API endpoint.
+
+        .. versionadded:: 3.3
+        """
+        return self._http.metrics
+
     async def set_adapter(self, adapter: BaseAdapter[Any]) -> None:
         """|coro|
 
@@ -657,11 +739,12 @@ class Client:
         if not token:
             payload: ClientCredentialsPayload = await self._http.client_credentials_token()
             validated: ValidateTokenPayload = await self._http.validate_token(payload.access_token)
-            token = payload.access_token
 
+            # Generated app tokens are refreshed ahead of expiry...
+            self._http._set_app_token(payload.access_token, expires_in=payload.expires_in)
             logger.info("Generated App Token for Client-ID: %s", validated.client_id)
-
-        self._http._app_token = token
+        else:
+            self._http._set_app_token(token)
 
         if load_tokens:
             async with self._http._token_lock:
@@ -1026,7 +1109,8 @@ class Client:
         You can override this method to implement your own token loading logic into the client, such as from a database.
 
         By default this method loads tokens from a file named `".tio.tokens.json"` if it is present;
-        always present if you use the default method of saving tokens.
+        always present if you use the default method of saving tokens. When a ``token_store`` was passed to the
+        :class:`~Client`, tokens are loaded from the store instead and ``path`` is ignored.
 
         **However**, it is preferred you would override this function to load your tokens from a database,
         as this has far less chance of being corrupted, damaged or lost.
@@ -1066,7 +1150,8 @@ class Client:
 
         .. note::
 
-            By default this method saves to a JSON file named `".tio.tokens.json"`.
+            By default this method saves to a JSON file named `".tio.tokens.json"`. When a ``token_store`` was passed to
+            the :class:`~Client`, this method instead waits for any pending changes to be written to the store.
 
         You can override this method to implement your own custom logic, such as saving tokens to a database, however
         it is preferred to use :meth:`~.add_token` to ensure the tokens are handled as they are added.
@@ -25,7 +25,7 @@ SOFTWARE.
 import enum
 
 
-__all__ = ("DeviceCodeRejection",)
+__all__ = ("DeviceCodeRejection", "RequestPriority")
 
 
 class DeviceCodeRejection(enum.Enum):
@@ -44,3 +44,26 @@ class DeviceCodeRejection(enum.Enum):
     UNKNOWN = "unknown"
     INVALID_REFRESH_TOKEN = "invalid refresh token"
     INVALID_DEVICE_CODE = "invalid device code"
+
+
+class RequestPriority(enum.IntEnum):
+    """An enum representing the priority of a request to the Twitch API.
+
+    When the rate limit of a token or the pool of connections is exhausted, queued requests with a higher priority are
+    sent before requests with a lower priority. Requests with the same priority are sent in the order they were made.
+
+    .. versionadded:: 3.3
+
+    Attributes
+    ----------
+    MODERATION
+        The highest priority. Used for time critical moderation actions, such as banning users and deleting chat messages.
+    INTERACTIVE
+        The default priority of requests.
+    BACKGROUND
+        The lowest priority. Used for the pages after the first page of a :class:`~twitchio.HTTPAsyncIterator`.
+    """
+
+    MODERATION = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
@@ -32,6 +32,7 @@ from .enums import DeviceCodeRejection
 __all__ = (
     "DeviceCodeFlowException",
     "HTTPException",
+    "HTTPTimeoutException",
     "InvalidTokenException",
     "MessageRejectedError",
     "MissingConduit",
@@ -87,6 +88,34 @@ class HTTPException(TwitchioException):
         super().__init__(msg)
 
 
+class HTTPTimeoutException(HTTPException):
+    """Exception raised when a request to the Twitch API does not complete within its timeout.
+
+    The timeout includes the time spent waiting for the rate limit, waiting for a connection and any retries.
+    When raised, the request is cancelled and no longer waiting to be sent.
+
+    This exception inherits from :exc:`~twitchio.HTTPException` and contains additional information.
+
+    .. versionadded:: 3.3
+
+    Attributes
+    ----------
+    timeout: float
+        The timeout in seconds which was exceeded.
+    route: :class:`twitchio.Route` | None
+        An optional :class:`twitchio.Route` supplied to this exception, which contains various information about the
+        request.
+    status: int
+        Always ``408``, as no response was received from Twitch.
+    extra: dict[Literal["message"], str]
+        A dict with a single key named "message", containing the exception message.
+    """
+
+    def __init__(self, msg: str = "", /, *, route: Route | None = None, timeout: float) -> None:
+        self.timeout: float = timeout
+        super().__init__(msg, route=route, status=408, extra=msg)
+
+
 class DeviceCodeFlowException(HTTPException):
     """Exception raised when an error occurs during a DCF (Device Code Flow).
 
@@ -24,6 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
 
 from twitchio.user import User
@@ -33,6 +34,8 @@ from .exceptions import *
 
 
 if TYPE_CHECKING:
+    from twitchio.loader import HelixLoader
+
     from .context import Context
 
 
@@ -103,7 +106,8 @@ class UserConverter(Converter[User]):
 
     .. note::
 
-        This converter uses an API call to attempt to fetch a valid :class:`twitchio.User`.
+        This converter uses an API call to attempt to fetch a valid :class:`twitchio.User`. Concurrent conversions are
+        batched into as few requests as possible with :attr:`twitchio.Client.loader`.
 
 
     Example
@@ -116,38 +120,29 @@ class UserConverter(Converter[User]):
     """
 
     async def convert(self, ctx: Context[Any], arg: str) -> User:
-        client = ctx.bot
+        loader: HelixLoader = ctx.bot.loader
 
         arg = arg.lower()
-        users: list[User]
+        user: User | None = None
         msg: str = 'Failed to convert "{}" to User. A User with the ID or login could not be found.'
 
+        # Lookups are batched with other concurrent conversions...
         if arg.startswith("@"):
             arg = arg.removeprefix("@")
-            users = await client.fetch_users(logins=[arg])
-
-            if not users:
-                raise BadArgument(msg.format(arg), value=arg)
-
-        if arg.isdigit():
-            users = await client.fetch_users(logins=[arg], ids=[arg])
+            user = await loader.fetch_user(login=arg)
+        elif arg.isdigit():
+            # Both are requested in the same batch; ID's should be taken into consideration first...
+            by_id: User | None
+            by_login: User | None
+            by_id, by_login = await asyncio.gather(loader.fetch_user(id=arg), loader.fetch_user(login=arg))
+            user = by_id or by_login
         else:
-            users = await client.fetch_users(logins=[arg])
-
-        potential: list[User] = []
-
-        for user in users:
-            # ID's should be taken into consideration first...
-            if user.id == arg:
-                return user
-
-            elif user.name == arg:
-                potential.append(user)
+            user = await loader.fetch_user(login=arg)
 
-        if potential:
-            return potential[0]
+        if user is None:
+            raise BadArgument(msg.format(arg), value=arg)
 
-        raise BadArgument(msg.format(arg), value=arg)
+        return user
 
 
 class ColourConverter(Converter[Colour]):
@@ -25,20 +25,27 @@ SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-import copy
+import contextlib
 import datetime
+import functools
+import inspect
 import logging
 import sys
+import time
 import urllib.parse
+import weakref
 from collections import deque
 from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Self, TypeAlias, TypeVar, Unpack
 
 import aiohttp
 
-from twitchio.exceptions import HTTPException
+from twitchio.exceptions import HTTPException, HTTPTimeoutException
 
 from . import __version__
+from .backoff import RetryPolicy
+from .enums import RequestPriority
+from .metrics import HTTPMetrics
 from .models.analytics import ExtensionAnalytics, GameAnalytics
 from .models.bits import ExtensionTransaction
 from .models.channel_points import CustomRewardRedemption
@@ -58,8 +65,17 @@ from .models.search import SearchChannel
 from .models.streams import Stream, VideoMarkers
 from .models.subscriptions import BroadcasterSubscription, BroadcasterSubscriptions
 from .models.videos import Video
+from .ratelimit import PrioritySemaphore, RateLimitBucket, RateLimiter, token_bucket_key
 from .user import ActiveExtensions, PartialUser
-from .utils import MISSING, Colour, _from_json, date_to_datetime_with_z, handle_user_ids, url_encode_datetime  # type: ignore
+from .utils import (  # type: ignore
+    MISSING,
+    Colour,
+    SingleFlight,
+    _from_json,
+    date_to_datetime_with_z,
+    handle_user_ids,
+    url_encode_datetime,
+)
 
 
 if TYPE_CHECKING:
@@ -68,6 +84,8 @@ if TYPE_CHECKING:
     from twitchio.types_.responses import ConduitPayload
 
     from .assets import Asset
+    from .backoff import Backoff
+    from .cache import AssetCache, ResponseCache
     from .eventsub.enums import SubscriptionType
     from .models.channel_points import CustomReward
     from .models.moderation import AutomodCheckMessage, AutomodSettings
@@ -78,6 +96,7 @@ if TYPE_CHECKING:
         SubscriptionResponse,
         _SubscriptionData,
     )
+    from .types_.options import HTTPClientOptions
     from .types_.requests import APIRequestKwargs, HTTPMethod, ParamMapping
     from .types_.responses import (
         AddBlockedTermResponse,
@@ -170,16 +189,25 @@ T = TypeVar("T")
 PaginatedConverter: TypeAlias = Callable[..., T] | None
 
 
+def decode_body(resp: aiohttp.ClientResponse, body: bytes) -> dict[str, Any] | str:
+    # JSON is decoded directly from bytes, skipping charset detection and decoding to str first...
+    if body and resp.content_type == "application/json":
+        return _from_json(body)  # type: ignore
+
+    return body.decode(resp.charset or "utf-8", errors="replace")
+
+
 async def json_or_text(resp: aiohttp.ClientResponse) -> dict[str, Any] | str:
-    text: str = await resp.text()
+    return decode_body(resp, await resp.read())
+
 
-    try:
-        if resp.headers["Content-Type"].startswith("application/json"):
-            return _from_json(text)  # type: ignore
-    except KeyError:
-        pass
+@functools.lru_cache(maxsize=4096)
+def _quote(value: str, safe: str, plus: bool) -> str:
+    # IDs, logins and other values are repeated often, so the encoded values are cached...
+    method = urllib.parse.quote_plus if plus else urllib.parse.quote
+    unquote = urllib.parse.unquote_plus if plus else urllib.parse.unquote
 
-    return text
+    return method(value, safe=safe) if unquote(value) == value else value
 
 
 class Route:
@@ -199,6 +227,21 @@ class Route:
         The headers used in the request.
     token_for: str
         The User ID that was used to gather a token for authentication. Could be an empty :class:`str`.
+    bucket: str | None
+        The key of the rate limit bucket this request is counted against. This is set when the request is made and
+        could be ``None`` beforehand.
+    priority: :class:`~twitchio.RequestPriority`
+        The priority of the request when queued behind other requests. Defaults to
+        :attr:`~twitchio.RequestPriority.INTERACTIVE`.
+    timeout: float | None
+        The time in seconds the request may take, including queueing and retries, before
+        :exc:`~twitchio.HTTPTimeoutException` is raised. Could be ``None`` to use the default of the client.
+    routable: bool
+        Whether the request can be made with any app or user token, allowing the client to pick the token with the most
+        remaining rate limit when token routing is enabled.
+    scopes: list[str]
+        The scopes a user token requires to be picked for this request when token routing is enabled. Could be an empty
+        :class:`list`.
     method: Literal['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS', 'HEAD', 'CONNECT', 'TRACE']
         The request method used.
     path: str
@@ -207,7 +250,10 @@ class Route:
 
     __slots__ = (
         "_base_url",
+        "_duplicate_key",
+        "_query",
         "_url",
+        "bucket",
         "data",
         "headers",
         "json",
@@ -215,6 +261,10 @@ class Route:
         "packed",
         "params",
         "path",
+        "priority",
+        "routable",
+        "scopes",
+        "timeout",
         "token_for",
         "use_id",
     )
@@ -232,14 +282,22 @@ class Route:
     ) -> None:
         self.params: ParamMapping = kwargs.pop("params", {})
         self.json: Any = kwargs.get("json", {})
-        self.headers: dict[str, str] = kwargs.get("headers", {})
+        # Headers are copied as static headers, E.g. OAuth.CONTENT_TYPE_HEADER, are shared between routes...
+        self.headers: dict[str, str] = dict(kwargs.get("headers", {}))
         self.token_for: str = str(kwargs.get("token_for", ""))
+        self.bucket: str | None = None
+        self.priority: RequestPriority = kwargs.get("priority", RequestPriority.INTERACTIVE)
+        self.timeout: float | None = kwargs.get("timeout")
+        self.routable: bool = kwargs.get("routable", False)
+        self.scopes: list[str] = kwargs.get("scopes", [])
 
         self.use_id = use_id
         self.method = method
         self.path = path
 
         self._base_url: str = ""
+        self._duplicate_key: bool = not use_id
+        self._query: dict[str, str] = {}
         self._url: str = self.build_url(duplicate_key=not use_id)
 
     def __str__(self) -> str:
@@ -252,38 +310,46 @@ class Route:
         base = self.ID_BASE if self.use_id else self.BASE
         self.path = self.path.lstrip("/").rstrip("/")
 
-        url: str = f"{base}{self.path}"
-        self._base_url = url
-
-        if not self.params:
-            return url
-
-        url += "?"
+        self._base_url = f"{base}{self.path}"
+        self._duplicate_key = duplicate_key
+        self._query = {}
 
         # We expect a dict so keys should be unique...
-        for key, value in copy.copy(self.params).items():
-            if value is None:
+        for key, value in list(self.params.items()):
+            segment: str | None = self._encode_param(key, value)
+
+            if segment is None:
                 if remove_none:
                     del self.params[key]
                 continue
 
-            if isinstance(value, (str, int)):
-                url += f"{key}={self.encode(str(value), safe='+', plus=True)}&"
-            elif duplicate_key:
-                for v in value:
-                    url += f"{key}={self.encode(str(v), safe='+', plus=True)}&"
-            else:
-                joined: str = "+".join([self.encode(str(v), safe="+") for v in value])
-                url += f"{key}={joined}&"
+            if segment:
+                self._query[key] = segment
+
+        return self._join_url()
+
+    def _encode_param(self, key: str, value: Any) -> str | None:
+        if value is None:
+            return None
+
+        if isinstance(value, (str, int)):
+            return f"{key}={_quote(str(value), '+', True)}"
+
+        if self._duplicate_key:
+            return "&".join([f"{key}={_quote(str(v), '+', True)}" for v in value])
+
+        joined: str = "+".join([_quote(str(v), "+", False) for v in value])
+        return f"{key}={joined}"
+
+    def _join_url(self) -> str:
+        if not self._query:
+            return self._base_url
 
-        return url.rstrip("&")
+        return f"{self._base_url}?{'&'.join(self._query.values())}"
 
     @classmethod
     def encode(cls, value: str, /, safe: str = "", plus: bool = False) -> str:
-        method = urllib.parse.quote_plus if plus else urllib.parse.quote
-        unquote = urllib.parse.unquote_plus if plus else urllib.parse.unquote
-
-        return method(value, safe=safe) if unquote(value) == value else value
+        return _quote(value, safe, plus)
 
     @property
     def url(self) -> str:
@@ -297,8 +363,20 @@ class Route:
 
     def update_params(self, params: ParamMapping, *, remove_none: bool = True) -> str:
         self.params.update(params)
-        self._url = self.build_url(remove_none=remove_none)
 
+        # Only the changed parameters are encoded again, E.g. the "after" cursor between pages...
+        for key, value in params.items():
+            segment: str | None = self._encode_param(key, value)
+
+            if segment:
+                self._query[key] = segment
+                continue
+
+            self._query.pop(key, None)
+            if segment is None and remove_none:
+                self.params.pop(key, None)
+
+        self._url = self._join_url()
         return self.url
 
     def update_headers(self, headers: dict[str, str]) -> None:
@@ -325,7 +403,14 @@ class HTTPAsyncIterator(Generic[T]):
     ``async for item in method(...)`` will continue making requests on paginated endpoints to the next page as needed
     and when available.
 
-    You can create a flattened list of all pages with a list comprehension.
+    You can create a flattened list of all pages with a list comprehension or :meth:`.flatten`, and iterate over whole pages
+    with :meth:`.pages`.
+
+    The next pages of a paginated endpoint can be requested in the background while the current page is being consumed with
+    :meth:`.prefetch`, and :meth:`.raw` returns the data received from Twitch without constructing models.
+
+    Pages after the first page are requested with :attr:`~twitchio.RequestPriority.BACKGROUND` priority, so long running
+    pagination does not delay other requests when the rate limit is exhausted.
 
     Examples
     --------
@@ -344,20 +429,37 @@ class HTTPAsyncIterator(Generic[T]):
             ...
             break
 
+        # Flatten and return every page, up to 1000 results...
+        streams = await bot.fetch_streams(first=100, max_results=1000).flatten()
+
+        # Iterate over whole pages at a time...
+        async for page in bot.fetch_streams(first=100, max_results=1000).pages():
+            ...
+
+        # Request the next page in the background while processing the current page...
+        async for item in bot.fetch_streams(first=100, max_results=1000).prefetch():
+            ...
+
 
     .. important::
 
-        Everything in this class is private internals, and should not be modified.
+        Everything in this class, other than the documented methods, is private internals and should not be modified.
     """
 
     __slots__ = (
+        "__weakref__",
         "_buffer",
         "_converter",
         "_cursor",
+        "_exhausted",
         "_first",
         "_http",
         "_max_results",
         "_nested_key",
+        "_pages",
+        "_prefetch",
+        "_prefetch_slots",
+        "_producer",
         "_route",
     )
 
@@ -383,13 +485,107 @@ class HTTPAsyncIterator(Generic[T]):
         self._buffer: deque[T] = deque()
         self._nested_key: str | None = nested_key
 
+        # Prefetching...
+        self._prefetch: int = 0
+        self._producer: asyncio.Task[None] | None = None
+        self._pages: asyncio.Queue[list[T] | BaseException] | None = None
+        self._prefetch_slots: asyncio.Semaphore | None = None
+        self._exhausted: bool = False
+
+    def __del__(self) -> None:
+        if self._producer and not self._producer.done():
+            try:
+                self._producer.cancel()
+            except RuntimeError:
+                # The event loop has already been closed...
+                pass
+
     def _base_converter(self, data: Any, *, raw: Any = None) -> T:
         if raw is None:
             raw = {}
 
         return data
 
-    async def _call_next(self) -> None:
+    def prefetch(self, depth: int = 1) -> Self:
+        """Enable prefetching of the next pages of a paginated endpoint while the current page is being consumed.
+
+        When enabled, the request for the next page is made in the background as soon as the cursor for it is known, so
+        network time overlaps with the time spent processing items. At most ``depth`` pages are requested ahead of the page
+        currently being consumed.
+
+        The background request is cancelled when this iterator is closed with :meth:`.aclose` or garbage collected,
+        E.g. after breaking from an ``async for`` loop.
+
+        This method must be called before iteration starts and returns the iterator for chaining.
+
+        .. versionadded:: 3.3
+
+        Parameters
+        ----------
+        depth: int
+            The maximum amount of pages to request ahead of the current page. Defaults to ``1``.
+            Setting this to ``0`` disables prefetching.
+
+        Examples
+        --------
+
+        .. code-block:: python3
+
+            async for clip in user.fetch_clips(first=100).prefetch(2):
+                ...
+        """
+        if self._producer is not None:
+            raise RuntimeError("Prefetching can not be changed after iteration has started.")
+
+        self._prefetch = max(depth, 0)
+        return self
+
+    def raw(self) -> HTTPAsyncIterator[RawResponse]:
+        """Return the raw data of each result as received from Twitch, without constructing any models.
+
+        This is useful when the results are only going to be serialized or stored, as no objects are created per result.
+        The data returned is the relevant ``TypedDict`` from ``twitchio.types_.responses``.
+
+        This method must be called before iteration starts and returns the iterator for chaining.
+
+        .. versionadded:: 3.3
+
+        Examples
+        --------
+
+        .. code-block:: python3
+
+            async for data in client.fetch_streams(first=100).raw():
+                print(data["user_login"], data["viewer_count"])
+
+            followers = await user.fetch_followers(first=100)
+            rows = await followers.followers.raw().flatten()
+        """
+        if self._producer is not None or self._buffer or self._cursor is not None:
+            raise RuntimeError("Raw mode can not be enabled after iteration has started.")
+
+        self._converter = self._base_converter
+        return self  # type: ignore
+
+    async def aclose(self) -> None:
+        """|coro|
+
+        Stop this iterator and cancel any page currently being prefetched.
+
+        .. versionadded:: 3.3
+        """
+        self._exhausted = True
+        self._buffer.clear()
+
+        if self._producer and not self._producer.done():
+            self._producer.cancel()
+
+            try:
+                await self._producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _fetch_page(self) -> list[T]:
         if self._cursor is False:
             raise StopAsyncIteration
 
@@ -400,31 +596,150 @@ class HTTPAsyncIterator(Generic[T]):
         data: RawResponse = await self._http.request_json(self._route)
         self._cursor = data.get("pagination", {}).get("cursor", False)
 
+        # Following pages are usually bulk reads and should not hold up other requests...
+        if self._route.priority is RequestPriority.INTERACTIVE:
+            self._route.priority = RequestPriority.BACKGROUND
+
         try:
             inner: list[RawResponse] = data["data"] if self._nested_key is None else data["data"][self._nested_key]
         except KeyError as e:
             raise HTTPException('Expected "data" key not found.', route=self._route, status=500, extra="") from e
 
-        if not self._nested_key:
-            for value in inner:
-                if self._max_results is None:
-                    self._buffer.append(await self._do_conversion(value, raw=data))
-                    continue
+        if self._nested_key:
+            inner = inner[:1]
+
+        if self._max_results is not None:
+            inner = inner[: self._max_results]
+            self._max_results -= len(inner)
+
+        # Conversion is done in a single synchronous pass over the page...
+        converter = self._converter
+        return [converter(value, raw=data) for value in inner]
+
+    @staticmethod
+    async def _produce(ref: weakref.ReferenceType[HTTPAsyncIterator[T]]) -> None:
+        # Only a weak reference is held while waiting, so breaking from a loop lets the iterator be collected and cancel us...
+        while True:
+            iterator: HTTPAsyncIterator[T] | None = ref()
+            if iterator is None:
+                return
+
+            pages, slots = iterator._pages, iterator._prefetch_slots
+            assert pages is not None and slots is not None
+            del iterator
+
+            # Wait until fewer than the prefetch depth pages are waiting to be consumed...
+            await slots.acquire()
+
+            iterator = ref()
+            if iterator is None:
+                return
+
+            try:
+                page: list[T] = await iterator._fetch_page()
+            except (StopAsyncIteration, Exception) as e:
+                pages.put_nowait(e)
+                return
+            finally:
+                del iterator
+
+            pages.put_nowait(page)
+
+    async def _next_page(self) -> list[T]:
+        if self._exhausted:
+            raise StopAsyncIteration
 
-                self._max_results -= 1  # If this is causing issues, it's just pylance bugged/desynced...
-                if self._max_results < 0:
-                    return
+        if not self._prefetch:
+            return await self._fetch_page()
 
-                self._buffer.append(await self._do_conversion(value, raw=data))
+        if self._producer is None:
+            # One slot is held by the page being consumed, the others by pages requested ahead of it...
+            self._pages = asyncio.Queue()
+            self._prefetch_slots = asyncio.Semaphore(self._prefetch + 1)
+            self._producer = asyncio.create_task(self._produce(weakref.ref(self)))
         else:
-            if self._max_results is not None:
-                self._max_results -= 1  # If this is causing issues, it's just pylance bugged/desynced...
-                if self._max_results < 0:
-                    return
-            self._buffer.append(await self._do_conversion(inner[0], raw=data))
+            # The previous page has been fully consumed...
+            assert self._prefetch_slots is not None
+            self._prefetch_slots.release()
+
+        assert self._pages is not None
+
+        page: list[T] | BaseException = await self._pages.get()
+
+        if isinstance(page, BaseException):
+            self._exhausted = True
+            raise page
+
+        return page
+
+    async def _call_next(self) -> None:
+        self._buffer.extend(await self._next_page())
+
+    async def pages(self) -> AsyncIterator[list[T]]:
+        """|aiter|
+
+        Iterate over whole pages of results as lists, instead of item by item.
+
+        Any items already buffered by iterating this iterator item by item are returned first as a single page.
 
-    async def _do_conversion(self, data: RawResponse, *, raw: RawResponse) -> T:
-        return self._converter(data, raw=raw)
+        .. versionadded:: 3.3
+
+        Examples
+        --------
+
+        .. code-block:: python3
+
+            async for page in client.fetch_videos(user_id=..., first=100).pages():
+                export(page)
+        """
+        if self._buffer:
+            page: list[T] = list(self._buffer)
+            self._buffer.clear()
+
+            yield page
+
+        while True:
+            try:
+                page = await self._next_page()
+            except StopAsyncIteration:
+                return
+
+            if not page:
+                return
+
+            yield page
+
+    async def flatten(self, *, max_pages: int | None = None) -> list[T]:
+        """|coro|
+
+        Return a flattened list of the results of every page, making requests to the next page as needed.
+
+        Unlike awaiting the iterator, which only returns the first page, this method follows pagination until no results
+        remain, ``max_results`` is reached or ``max_pages`` pages have been returned.
+
+        .. versionadded:: 3.3
+
+        Parameters
+        ----------
+        max_pages: int | None
+            An optional maximum amount of pages to collect. Defaults to ``None`` which collects every page.
+
+        Returns
+        -------
+        list[T]
+            A flattened list of the results of every page.
+        """
+        items: list[T] = []
+        count: int = 0
+
+        async for page in self.pages():
+            items.extend(page)
+            count += 1
+
+            if max_pages is not None and count >= max_pages:
+                break
+
+        return items
 
     async def _flatten(self) -> list[T]:
         if not self._buffer:
@@ -450,27 +765,168 @@ class HTTPAsyncIterator(Generic[T]):
         return data
 
 
+class ConnectionPool:
+    """Configuration for the pool of connections shared by TwitchIO's HTTP clients.
+
+    A single :class:`aiohttp.TCPConnector` is created from this configuration and shared between the session used for
+    requests to the Twitch API and assets, and the session used for OAuth. Connections are kept alive and reused between
+    requests, and DNS lookups are cached.
+
+    When every connection is in use, requests to the Twitch API are queued by :class:`~twitchio.RequestPriority`.
+
+    Pass an instance of this class to :class:`~twitchio.Client` with the ``connection_pool`` parameter to configure it.
+    This has no effect when a custom ``session`` is provided.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    limit: int
+        The maximum amount of simultaneous connections. Defaults to ``100``.
+    limit_per_host: int
+        The maximum amount of simultaneous connections to a single host. Defaults to ``0`` which is unlimited.
+    keepalive_timeout: float
+        The time in seconds idle connections are kept alive for reuse. Defaults to ``30.0``.
+    ttl_dns_cache: int | None
+        The time in seconds DNS lookups are cached for. Defaults to ``300``. ``None`` caches lookups forever.
+    use_dns_cache: bool
+        Whether DNS lookups should be cached. Defaults to ``True``.
+    happy_eyeballs_delay: float | None
+        The delay in seconds before attempting the next address when connecting, as per RFC 8305 (Happy Eyeballs).
+        Defaults to ``0.25``. ``None`` disables Happy Eyeballs. Requires ``aiohttp>=3.10``; ignored on older versions.
+    """
+
+    __slots__ = (
+        "_connector",
+        "_slots",
+        "happy_eyeballs_delay",
+        "keepalive_timeout",
+        "limit",
+        "limit_per_host",
+        "ttl_dns_cache",
+        "use_dns_cache",
+    )
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int | None = 300,
+        use_dns_cache: bool = True,
+        happy_eyeballs_delay: float | None = 0.25,
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: int | None = ttl_dns_cache
+        self.use_dns_cache: bool = use_dns_cache
+        self.happy_eyeballs_delay: float | None = happy_eyeballs_delay
+
+        self._connector: aiohttp.TCPConnector | None = None
+
+        # Requests queue here by priority instead of in the connector when every connection is in use...
+        slots: int = min(filter(None, (limit, limit_per_host)), default=0)
+        self._slots: PrioritySemaphore | None = PrioritySemaphore(slots) if slots else None
+
+    def __repr__(self) -> str:
+        return f"ConnectionPool(limit={self.limit}, limit_per_host={self.limit_per_host})"
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        """The :class:`aiohttp.TCPConnector` created from this configuration.
+
+        The connector is created on first access, and created again if it has been closed.
+        """
+        if self._connector is None or self._connector.closed:
+            kwargs: dict[str, Any] = {}
+            if "happy_eyeballs_delay" in inspect.signature(aiohttp.TCPConnector).parameters:
+                kwargs["happy_eyeballs_delay"] = self.happy_eyeballs_delay
+
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+                use_dns_cache=self.use_dns_cache,
+                **kwargs,
+            )
+
+        return self._connector
+
+    async def close(self) -> None:
+        """|coro|
+
+        Close the connector and every pooled connection.
+        """
+        if self._connector and not self._connector.closed:
+            await self._connector.close()
+
+        self._connector = None
+
+
 class HTTPClient:
-    __slots__ = ("_client_id", "_session", "_session_set", "_should_close", "user_agent")
+    __slots__ = (
+        "_asset_cache",
+        "_cache",
+        "_client_id",
+        "_coalesce",
+        "_headers",
+        "_inflight",
+        "_metrics",
+        "_owns_pool",
+        "_pool",
+        "_ratelimiter",
+        "_request_timeout",
+        "_retry_policy",
+        "_session",
+        "_session_set",
+        "_should_close",
+        "user_agent",
+    )
 
-    def __init__(self, session: aiohttp.ClientSession = MISSING, *, client_id: str) -> None:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession = MISSING,
+        *,
+        client_id: str,
+        **options: Unpack[HTTPClientOptions],
+    ) -> None:
         self._session: aiohttp.ClientSession = session
         self._should_close: bool = session is MISSING
         self._session_set: bool = False
 
         self._client_id: str = client_id
+        self._ratelimiter: RateLimiter = RateLimiter()
+        self._retry_policy: RetryPolicy = options.get("retry_policy") or RetryPolicy()
+
+        # Identical GET requests which are already in flight share a single request...
+        self._coalesce: bool = options.get("coalesce_requests", True)
+        self._inflight: SingleFlight[tuple[str, str, str], RawResponse | str | None] = SingleFlight(cancel_unused=True)
+
+        self._request_timeout: float | None = options.get("request_timeout")
+
+        self._cache: ResponseCache | None = options.get("response_cache")
+        self._asset_cache: AssetCache | None = options.get("asset_cache")
+        self._metrics: HTTPMetrics = options.get("metrics") or HTTPMetrics()
+
+        pool: ConnectionPool | None = options.get("connection_pool")
+        self._owns_pool: bool = pool is None
+        self._pool: ConnectionPool = pool or ConnectionPool()
 
         # User Agent...
         pyver = f"{sys.version_info[0]}.{sys.version_info[1]}"
         ua = "TwitchioClient (https://github.com/TwitchIO/TwitchIO {0}) Python/{1} aiohttp/{2}"
         self.user_agent: str = ua.format(__version__, pyver, aiohttp.__version__)
 
-    @property
-    def headers(self) -> dict[str, str]:
         # If the user somehow gets a client_id passed that isn't a str
         # this will allow Twitch to throw a reasonable HTTPException
+        self._headers: dict[str, str] = {"User-Agent": self.user_agent, "Client-ID": str(self._client_id)}
 
-        return {"User-Agent": self.user_agent, "Client-ID": str(self._client_id)}
+    @property
+    def headers(self) -> dict[str, str]:
+        return self._headers
 
     async def _init_session(self) -> None:
         if self._session_set:
@@ -482,7 +938,7 @@ class HTTPClient:
             return
 
         logger.debug("Initialising ClientSession on %s.", self.__class__.__qualname__)
-        self._session = aiohttp.ClientSession(headers=self.headers)
+        self._session = aiohttp.ClientSession(headers=self.headers, connector=self._pool.connector, connector_owner=False)
 
     def clear(self) -> None:
         if self._session and self._session.closed:
@@ -505,7 +961,107 @@ class HTTPClient:
             self.clear()
             logger.debug("%s session closed successfully.", self.__class__.__qualname__)
 
+        if self._owns_pool:
+            await self._pool.close()
+
+        if self._asset_cache is not None:
+            await self._asset_cache.flush()
+
+    def _bucket_key(self, route: Route) -> str:
+        if route.bucket:
+            return route.bucket
+
+        token: str | None = route.headers.get("Authorization")
+        if token:
+            return token_bucket_key(token.removeprefix("Bearer ").removeprefix("OAuth "))
+
+        return "app"
+
+    def _get_bucket(self, route: Route) -> RateLimitBucket | None:
+        # The ID endpoints are not subject to the Helix rate limit...
+        if route.use_id:
+            return None
+
+        return self._ratelimiter.get(self._bucket_key(route))
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def metrics(self) -> HTTPMetrics:
+        return self._metrics
+
+    @property
+    def asset_cache(self) -> AssetCache | None:
+        return self._asset_cache
+
     async def request(self, route: Route) -> RawResponse | str | None:
+        if self._cache is not None and self._cache.cacheable(route):
+            cached: RawResponse | str | None = self._cache.get(route)
+
+            if cached is not MISSING:
+                logger.debug("Returning cached response for request to %r.", route)
+                return cached
+
+        timeout: float | None = route.timeout if route.timeout is not None else self._request_timeout
+        if timeout is None:
+            return await self._send(route, deadline=None)
+
+        # The deadline covers queueing for the rate limit and connections, and every retry...
+        deadline: float = asyncio.get_running_loop().time() + timeout
+        context: asyncio.Timeout = asyncio.timeout_at(deadline)
+
+        try:
+            async with context:
+                return await self._send(route, deadline=deadline)
+        except TimeoutError as e:
+            if not context.expired():
+                raise
+
+            raise HTTPTimeoutException(
+                f"Request {route} did not complete within {timeout}s.",
+                route=route,
+                timeout=timeout,
+            ) from e
+
+    async def _send(self, route: Route, *, deadline: float | None) -> RawResponse | str | None:
+        # Called within the deadline of the request. Subclasses which retry requests, E.g. after refreshing a token,
+        # should override this instead of request so the retries are bounded by the same deadline...
+        return await self._dispatch(route, deadline=deadline)
+
+    async def _dispatch(self, route: Route, *, deadline: float | None) -> RawResponse | str | None:
+        if not self._coalesce or route.method != "GET":
+            return await self._request(route, deadline=deadline)
+
+        key: tuple[str, str, str] = (route.method, route.url, self._bucket_key(route))
+        if key in self._inflight:
+            logger.debug("Coalescing request to %r with an identical request already in flight.", route)
+
+        # Each waiter enforces its own deadline, while retries are bounded by the deadline of the first. The request is
+        # cancelled once every waiter has given up, so it no longer holds its place in the queue...
+        return await self._inflight.run(key, lambda: self._request(route, deadline=deadline))
+
+    @staticmethod
+    def _can_wait(wait: float, deadline: float | None) -> bool:
+        return deadline is None or asyncio.get_running_loop().time() + wait < deadline
+
+    @contextlib.asynccontextmanager
+    async def _connection_slot(self, route: Route) -> AsyncIterator[None]:
+        # A custom session does not use our pool of connections...
+        slots: PrioritySemaphore | None = self._pool._slots if self._should_close else None
+
+        if slots is None:
+            yield
+            return
+
+        await slots.acquire(route.priority)
+        try:
+            yield
+        finally:
+            slots.release()
+
+    async def _request(self, route: Route, *, deadline: float | None = None) -> RawResponse | str | None:
         if not self._session_set:
             await self._init_session()
 
@@ -514,35 +1070,89 @@ class HTTPClient:
         logger.debug("Attempting a request to %r with %s.", route, self.__class__.__qualname__)
         route.headers.update(self.headers)
 
-        failed: bool = False
+        bucket: RateLimitBucket | None = self._get_bucket(route)
+        policy: RetryPolicy = self._retry_policy.for_route(route)
+        # Created on the first retry, as most requests are never retried...
+        backoff: Backoff | None = None
+
+        attempt: int = 0
         while True:
-            async with self._session.request(
-                route.method,
-                route.url,
-                headers=route.headers,
-                json=route.json or None,
-            ) as resp:
-                data: RawResponse | str = await json_or_text(resp)
-                logger.debug("Request to %r with %s returned: status=%d", route, self.__class__.__qualname__, resp.status)
-
-                if resp.status == 503 and not failed:
-                    # Twitch recommends retrying 1 time after a 503...
-                    failed = True
-                    logger.debug("Retrying request to %r (1) times after 3 seconds.", route)
-
-                    await asyncio.sleep(3)
-                    continue
-
-                if resp.status >= 400:
-                    raise HTTPException(
-                        f"Request {route} failed with status {resp.status}: {data}",
-                        route=route,
-                        status=resp.status,
-                        extra=data,
-                    )
-
-                if resp.status == 204:
-                    return None
+            attempt += 1
+            if bucket:
+                await bucket.acquire(route.priority)
+
+            start: float = time.perf_counter()
+            try:
+                async with self._connection_slot(route):
+                    start = time.perf_counter()
+
+                    async with self._session.request(
+                        route.method,
+                        route.url,
+                        headers=route.headers,
+                        json=route.json or None,
+                    ) as resp:
+                        if bucket:
+                            bucket.update(resp.headers)
+
+                        body: bytes = await resp.read()
+                        data: RawResponse | str = decode_body(resp, body)
+                        status: int = resp.status
+                        logger.debug("Request to %r with %s returned: status=%d", route, self.__class__.__qualname__, status)
+
+                        remaining: str | None = resp.headers.get("Ratelimit-Remaining")
+                        self._metrics.record(
+                            route,
+                            status=status,
+                            latency=time.perf_counter() - start,
+                            size=len(body),
+                            ratelimit_remaining=int(remaining) if remaining and remaining.isdigit() else None,
+                            retry=attempt > 1,
+                        )
+            except (aiohttp.ClientConnectorError, aiohttp.ServerDisconnectedError) as e:
+                self._metrics.record(route, status=0, latency=time.perf_counter() - start, retry=attempt > 1)
+
+                if not policy.should_retry(route, attempt, error=e):
+                    raise
+
+                backoff = backoff or policy.backoff()
+                wait: float = policy.delay(backoff)
+                if not self._can_wait(wait, deadline):
+                    raise
+
+                logger.debug("Request to %r failed: %s. Retrying (%d) after %.2fs.", route, e, attempt, wait)
+
+                await asyncio.sleep(wait)
+                continue
+
+            if status == 429 and bucket:
+                bucket.exhaust()
+
+            if status >= 400:
+                if policy.should_retry(route, attempt, status=status):
+                    reset: float | None = bucket.reset if bucket else None
+                    backoff = backoff or policy.backoff()
+                    wait: float = policy.delay(backoff, status=status, reset=reset)
+
+                    # Retrying is pointless when the wait alone would pass the deadline...
+                    if self._can_wait(wait, deadline):
+                        logger.debug("Request to %r returned %d. Retrying (%d) after %.2fs.", route, status, attempt, wait)
+
+                        await asyncio.sleep(wait)
+                        continue
+
+                raise HTTPException(
+                    f"Request {route} failed with status {status}: {data}",
+                    route=route,
+                    status=status,
+                    extra=data,
+                )
+
+            if status == 204:
+                return None
+
+            if self._cache is not None and self._cache.cacheable(route):
+                self._cache.set(route, data, size=len(body))
 
             return data
 
@@ -570,23 +1180,37 @@ class HTTPClient:
 
             return dict(resp.headers)
 
-    async def _request_asset(self, asset: Asset, *, chunk_size: int = 1024) -> AsyncIterator[bytes]:
+    async def _request_asset(self, asset: Asset, *, chunk_size: int = 65536, offset: int = 0) -> AsyncIterator[bytes]:
         if not self._session_set:
             await self._init_session()
 
         assert self._session is not None
 
         logger.debug('Attempting a request to asset "%r" with %s.', asset, self.__class__.__qualname__)
+        headers: dict[str, str] = {"Range": f"bytes={offset}-"} if offset else {}
 
-        async with self._session.get(asset.url) as resp:
-            if resp.status != 200:
+        async with self._session.get(asset.url, headers=headers) as resp:
+            if resp.status == 416 and offset:
+                # The requested range starts at the end of the asset, so there is nothing left to download...
+                return
+
+            if resp.status not in (200, 206):
                 msg = f'Failed to get asset at "{asset.url}" with status {resp.status}.'
                 raise HTTPException(msg, status=resp.status, extra=await resp.text())
 
-            headers: dict[str, str] = dict(resp.headers)
-            asset._set_ext(headers)
+            asset._set_ext(dict(resp.headers))
+
+            # The server ignored the range and sent the whole asset, so skip what we already have...
+            skip: int = offset if resp.status == 200 else 0
 
             async for chunk in resp.content.iter_chunked(chunk_size):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+
+                    chunk, skip = chunk[skip:], 0
+
                 yield chunk
 
     def request_paginated(
@@ -750,7 +1374,7 @@ class HTTPClient:
     ) -> ChannelInformationResponse:
         params = {"broadcaster_id": broadcaster_ids}
 
-        route: Route = Route("GET", "channels", params=params, token_for=token_for)
+        route: Route = Route("GET", "channels", params=params, token_for=token_for, routable=True)
         return await self.request_json(route)
 
     async def patch_channel_info(
@@ -1121,7 +1745,7 @@ class HTTPClient:
     ) -> UserChatColorResponse:
         params: dict[str, list[str | int]] = {"user_id": user_ids}
 
-        route: Route = Route("GET", "chat/color", params=params, token_for=token_for)
+        route: Route = Route("GET", "chat/color", params=params, token_for=token_for, routable=True)
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1225,7 +1849,9 @@ class HTTPClient:
         }
         data = {k: v for k, v in _data.items() if v is not None}
 
-        route: Route = Route("PATCH", "chat/settings", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "PATCH", "chat/settings", params=params, json=data, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1325,7 +1951,7 @@ class HTTPClient:
         if is_featured is not None:
             params["is_featured"] = is_featured
 
-        route: Route = Route("GET", "clips", params=params, token_for=token_for)
+        route: Route = Route("GET", "clips", params=params, token_for=token_for, routable=True)
 
         def converter(data: ClipsResponseData, *, raw: Any) -> Clip:
             return Clip(data, http=self)
@@ -1561,7 +2187,7 @@ class HTTPClient:
     ) -> HTTPAsyncIterator[Game]:
         params: dict[str, int] = {"first": first}
 
-        route: Route = Route("GET", "games/top", params=params, token_for=token_for)
+        route: Route = Route("GET", "games/top", params=params, token_for=token_for, routable=True)
 
         def converter(data: TopGamesResponseData, *, raw: Any) -> Game:
             return Game(data, http=self)
@@ -1587,7 +2213,7 @@ class HTTPClient:
         if igdb_ids is not None:
             params["igdb_id"] = igdb_ids
 
-        route: Route = Route("GET", "games", params=params, token_for=token_for)
+        route: Route = Route("GET", "games", params=params, token_for=token_for, routable=True)
         return await self.request_json(route)
 
     ### Goals ###
@@ -1653,7 +2279,9 @@ class HTTPClient:
     ) -> None:
         data = {"user_id": user_id, "msg_id": msg_id, "action": action}
 
-        route: Route = Route("POST", "moderation/automod/message", json=data, token_for=token_for)
+        route: Route = Route(
+            "POST", "moderation/automod/message", json=data, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1721,7 +2349,9 @@ class HTTPClient:
         if reason is not None:
             data["data"]["reason"] = reason
 
-        route: Route = Route("POST", "moderation/bans", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST", "moderation/bans", params=params, json=data, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1734,7 +2364,9 @@ class HTTPClient:
     ) -> None:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id, "user_id": user_id}
 
-        route: Route = Route("DELETE", "moderation/bans", params=params, token_for=token_for)
+        route: Route = Route(
+            "DELETE", "moderation/bans", params=params, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1818,7 +2450,14 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
         data = {"text": text}
 
-        route: Route = Route("POST", "moderation/blocked_terms", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST",
+            "moderation/blocked_terms",
+            params=params,
+            json=data,
+            token_for=token_for,
+            priority=RequestPriority.MODERATION,
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -1846,7 +2485,9 @@ class HTTPClient:
         if message_id is not None:
             params["message_id"] = message_id
 
-        route: Route = Route("DELETE", "moderation/chat", params=params, token_for=token_for)
+        route: Route = Route(
+            "DELETE", "moderation/chat", params=params, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     def get_moderated_channels(
@@ -1976,7 +2617,14 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
         data = {"is_active": active}
 
-        route: Route = Route("PUT", "moderation/shield_mode", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "PUT",
+            "moderation/shield_mode",
+            params=params,
+            json=data,
+            token_for=token_for,
+            priority=RequestPriority.MODERATION,
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -2003,7 +2651,9 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
         data = {"data": {"user_id": user_id, "reason": reason}}
 
-        route: Route = Route("POST", "moderation/warnings", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST", "moderation/warnings", params=params, json=data, token_for=token_for, priority=RequestPriority.MODERATION
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -2018,7 +2668,14 @@ class HTTPClient:
         params = {"broadcaster_id": broadcaster_id, "moderator_id": moderator_id}
         data = {"user_id": user_id, "status": status}
 
-        route: Route = Route("POST", "moderation/suspicious_users", params=params, json=data, token_for=token_for)
+        route: Route = Route(
+            "POST",
+            "moderation/suspicious_users",
+            params=params,
+            json=data,
+            token_for=token_for,
+            priority=RequestPriority.MODERATION,
+        )
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -2327,7 +2984,7 @@ class HTTPClient:
             "query": query,
             "first": first,
         }
-        route: Route = Route("GET", "search/categories", params=params, token_for=token_for)
+        route: Route = Route("GET", "search/categories", params=params, token_for=token_for, routable=True)
 
         def converter(data: GamesResponseData, *, raw: Any) -> Game:
             return Game(data, http=self)
@@ -2346,7 +3003,7 @@ class HTTPClient:
         max_results: int | None = None,
     ) -> HTTPAsyncIterator[SearchChannel]:
         params: dict[str, str | int] = {"query": query, "live_only": live, "first": first}
-        route: Route = Route("GET", "search/channels", params=params, token_for=token_for)
+        route: Route = Route("GET", "search/channels", params=params, token_for=token_for, routable=True)
 
         def converter(data: SearchChannelsResponseData, *, raw: Any) -> SearchChannel:
             return SearchChannel(data, http=self)
@@ -2386,7 +3043,7 @@ class HTTPClient:
         if languages is not None:
             params["language"] = languages
 
-        route: Route = Route("GET", "streams", params=params, token_for=token_for)
+        route: Route = Route("GET", "streams", params=params, token_for=token_for, routable=True)
 
         def converter(data: StreamsResponseData, *, raw: Any) -> Stream:
             return Stream(data, http=self)
@@ -2520,7 +3177,7 @@ class HTTPClient:
         elif team_id:
             params = {"id": team_id}
 
-        route: Route = Route("GET", "teams", params=params, token_for=token_for)
+        route: Route = Route("GET", "teams", params=params, token_for=token_for, routable=True)
         return await self.request_json(route)
 
     @handle_user_ids()
@@ -2532,7 +3189,7 @@ class HTTPClient:
     ) -> ChannelTeamsResponse:
         params = {"broadcaster_id": broadcaster_id}
 
-        route: Route = Route("GET", "teams/channel", params=params, token_for=token_for)
+        route: Route = Route("GET", "teams/channel", params=params, token_for=token_for, routable=True)
         return await self.request_json(route)
 
     ### Users ###
@@ -2542,7 +3199,8 @@ class HTTPClient:
         self, ids: list[str | int] | None = None, logins: list[str] | None = None, token_for: str | PartialUser | None = None
     ) -> UsersResponse:
         params = {"id": ids, "login": logins}
-        route: Route = Route("GET", "users", params=params, token_for=token_for)
+        # Without IDs or logins the user of the token is returned, so the token can only be picked when they are provided...
+        route: Route = Route("GET", "users", params=params, token_for=token_for, routable=bool(ids or logins))
         return await self.request_json(route)
 
     async def put_user(self, token_for: str, description: str | None) -> UpdateUserResponse:
@@ -2646,7 +3304,7 @@ class HTTPClient:
         if language is not None:
             params["language"] = language
 
-        route = Route("GET", "videos", params=params, token_for=token_for)
+        route = Route("GET", "videos", params=params, token_for=token_for, routable=True)
 
         def converter(data: VideosResponseData, *, raw: Any) -> Video:
             return Video(data, http=self)
@@ -0,0 +1,342 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
+
+from .models.channels import ChannelInfo
+from .models.games import Game
+from .user import PartialUser, User
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+
+    from .http import HTTPClient
+    from .models.streams import Stream
+
+
+__all__ = ("BatchLoader", "HelixLoader")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+# Twitch rejects the whole request when any login is malformed, so these are never added to a batch...
+LOGIN_REGEX: re.Pattern[str] = re.compile(r"[a-z0-9_]{1,25}")
+
+
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """A loader which collects individual lookups made during a short window and resolves them in batches.
+
+    Every key requested during ``window`` seconds is collected and passed to ``fetch`` in batches of at most ``max_batch``
+    keys. Each caller is then resolved with the value for their key, or ``None`` when ``fetch`` did not return one.
+    Duplicate keys in the same window share a single lookup.
+
+    .. versionadded:: 3.3
+
+    Parameters
+    ----------
+    fetch: Callable[[list[K]], Awaitable[Mapping[K, V]]]
+        A coroutine function which receives a list of keys and returns a mapping of the found keys to their values.
+    window: float
+        The time in seconds to collect keys for before making a request. Defaults to ``0.01``.
+    max_batch: int
+        The maximum amount of keys passed to ``fetch`` at once. Defaults to ``100``, the maximum most Helix endpoints
+        accept. When this many keys are pending, the batch is sent without waiting for the window to pass.
+    """
+
+    __slots__ = ("_fetch", "_handle", "_pending", "_tasks", "max_batch", "window")
+
+    def __init__(
+        self,
+        fetch: Callable[[list[K]], Awaitable[Mapping[K, V]]],
+        *,
+        window: float = 0.01,
+        max_batch: int = 100,
+    ) -> None:
+        self._fetch = fetch
+        self.window: float = window
+        self.max_batch: int = max_batch
+
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __repr__(self) -> str:
+        return f"BatchLoader(window={self.window}, max_batch={self.max_batch}, pending={len(self._pending)})"
+
+    async def load(self, key: K) -> V | None:
+        """|coro|
+
+        Load the value for a single key, batched with any other keys requested during the window.
+
+        Returns
+        -------
+        V | None
+            The value for ``key`` or ``None`` if it could not be found.
+        """
+        future: asyncio.Future[V | None] | None = self._pending.get(key)
+
+        if future is None:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            future = self._pending[key] = loop.create_future()
+
+            if len(self._pending) >= self.max_batch:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self.window, self._dispatch)
+
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """|coro|
+
+        Load the values for multiple keys, batched with any other keys requested during the window.
+
+        Returns
+        -------
+        list[V | None]
+            The values for each key, in the same order as ``keys``. Keys which could not be found are ``None``.
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        pending, self._pending = self._pending, {}
+        keys: list[K] = list(pending)
+
+        for i in range(0, len(keys), self.max_batch):
+            batch: dict[K, asyncio.Future[V | None]] = {key: pending[key] for key in keys[i : i + self.max_batch]}
+
+            task: asyncio.Task[None] = asyncio.create_task(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[K, asyncio.Future[V | None]]) -> None:
+        logger.debug("Loading a batch of %d keys with %r.", len(batch), self)
+
+        try:
+            found: Mapping[K, V] = await self._fetch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class HelixLoader:
+    """Batched lookups of users, streams, channels and games.
+
+    Individual lookups made within a short window are merged into as few requests as possible, with up to ``100`` IDs or
+    logins per request. This is useful when many concurrent tasks, such as command converters or chat message handlers,
+    each need to look up a single object.
+
+    Lookups are only batched with other lookups using the same ``token_for``.
+
+    You should not instantiate this class manually, instead use :attr:`twitchio.Client.loader`.
+
+    .. versionadded:: 3.3
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        # Each of these calls are made in the same request...
+        users = await asyncio.gather(*(client.loader.fetch_user(id=id_) for id_ in ids))
+    """
+
+    __slots__ = ("_http", "_loaders", "window")
+
+    def __init__(self, http: HTTPClient, *, window: float = 0.01) -> None:
+        self._http: HTTPClient = http
+        self._loaders: dict[tuple[str, str | None], BatchLoader[Any, Any]] = {}
+        self.window: float = window
+
+    def __repr__(self) -> str:
+        return f"HelixLoader(window={self.window})"
+
+    def _get_loader(
+        self,
+        kind: Literal["user", "stream", "channel", "game"],
+        token_for: str | PartialUser | None,
+    ) -> BatchLoader[Any, Any]:
+        token: str | None = (token_for.id if isinstance(token_for, PartialUser) else str(token_for)) if token_for else None
+        key: tuple[str, str | None] = (kind, token)
+
+        try:
+            return self._loaders[key]
+        except KeyError:
+            pass
+
+        fetch: Callable[[str | None, list[str]], Awaitable[Mapping[str, Any]]] = getattr(self, f"_fetch_{kind}")
+        loader = self._loaders[key] = BatchLoader(functools.partial(fetch, token), window=self.window)
+        return loader
+
+    async def _fetch_user(self, token_for: str | None, keys: list[tuple[str, str]]) -> Mapping[tuple[str, str], User]:
+        # IDs and logins are requested together, as Helix accepts up to 100 of both combined...
+        ids: list[str | int] = [value for kind, value in keys if kind == "id"]
+        logins: list[str] = [value for kind, value in keys if kind == "login"]
+
+        data = await self._http.get_users(ids=ids or None, logins=logins or None, token_for=token_for)
+        found: dict[tuple[str, str], User] = {}
+
+        for d in data["data"]:
+            user: User = User(d, http=self._http)
+            found["id", d["id"]] = found["login", d["login"]] = user
+
+        return found
+
+    async def _fetch_stream(self, token_for: str | None, keys: list[str]) -> Mapping[str, Stream]:
+        iterator = self._http.get_streams(user_ids=keys, first=100, token_for=token_for, max_results=100)  # type: ignore
+        return {stream.user.id: stream async for stream in iterator}
+
+    async def _fetch_channel(self, token_for: str | None, keys: list[str]) -> Mapping[str, ChannelInfo]:
+        data = await self._http.get_channel_info(broadcaster_ids=keys, token_for=token_for)  # type: ignore
+        return {d["broadcaster_id"]: ChannelInfo(d, http=self._http) for d in data["data"]}
+
+    async def _fetch_game(self, token_for: str | None, keys: list[str]) -> Mapping[str, Game]:
+        data = await self._http.get_games(ids=keys, token_for=token_for)
+        return {d["id"]: Game(d, http=self._http) for d in data["data"]}
+
+    async def fetch_user(
+        self,
+        *,
+        id: str | int | None = None,
+        login: str | None = None,
+        token_for: str | PartialUser | None = None,
+    ) -> User | None:
+        """|coro|
+
+        Fetch a single :class:`~twitchio.User` by ID or login, batched with other user lookups.
+
+        Parameters
+        ----------
+        id: str | int | None
+            The ID of the user to fetch.
+        login: str | None
+            The login of the user to fetch. Only used when ``id`` is not provided.
+        token_for: str | PartialUser | None
+            An optional User ID that will be used to find an appropriate managed user token for this request.
+
+        Returns
+        -------
+        :class:`~twitchio.User` | None
+            The user or ``None`` if the user could not be found. Malformed IDs and logins are not requested and always
+            return ``None``.
+
+        Raises
+        ------
+        ValueError
+            Neither ``id`` or ``login`` was provided.
+        """
+        if id is not None:
+            id = str(id)
+            return await self._get_loader("user", token_for).load(("id", id)) if id.isdigit() else None
+
+        if login is not None:
+            login = login.lower().removeprefix("@")
+            return await self._get_loader("user", token_for).load(("login", login)) if LOGIN_REGEX.fullmatch(login) else None
+
+        raise ValueError('One of "id" or "login" is a required parameter.')
+
+    async def fetch_stream(self, user_id: str | int, *, token_for: str | PartialUser | None = None) -> Stream | None:
+        """|coro|
+
+        Fetch the :class:`~twitchio.Stream` of a single broadcaster, batched with other stream lookups.
+
+        Parameters
+        ----------
+        user_id: str | int
+            The ID of the broadcaster to fetch the stream of.
+        token_for: str | PartialUser | None
+            An optional User ID that will be used to find an appropriate managed user token for this request.
+
+        Returns
+        -------
+        :class:`~twitchio.Stream` | None
+            The stream or ``None`` if the broadcaster is not live.
+        """
+        return await self._get_loader("stream", token_for).load(str(user_id))
+
+    async def fetch_channel(
+        self,
+        broadcaster_id: str | int,
+        *,
+        token_for: str | PartialUser | None = None,
+    ) -> ChannelInfo | None:
+        """|coro|
+
+        Fetch the :class:`~twitchio.ChannelInfo` of a single broadcaster, batched with other channel lookups.
+
+        Parameters
+        ----------
+        broadcaster_id: str | int
+            The ID of the broadcaster to fetch the channel information of.
+        token_for: str | PartialUser | None
+            An optional User ID that will be used to find an appropriate managed user token for this request.
+
+        Returns
+        -------
+        :class:`~twitchio.ChannelInfo` | None
+            The channel information or ``None`` if the channel could not be found.
+        """
+        return await self._get_loader("channel", token_for).load(str(broadcaster_id))
+
+    async def fetch_game(self, id: str | int, *, token_for: str | PartialUser | None = None) -> Game | None:
+        """|coro|
+
+        Fetch a single :class:`~twitchio.Game` by ID, batched with other game lookups.
+
+        Parameters
+        ----------
+        id: str | int
+            The ID of the game to fetch.
+        token_for: str | PartialUser | None
+            An optional User ID that will be used to find an appropriate managed user token for this request.
+
+        Returns
+        -------
+        :class:`~twitchio.Game` | None
+            The game or ``None`` if the game could not be found.
+        """
+        return await self._get_loader("game", token_for).load(str(id))
@@ -0,0 +1,214 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter
+from typing import TYPE_CHECKING, Any, ClassVar
+
+
+if TYPE_CHECKING:
+    from .http import Route
+
+
+__all__ = ("HTTPMetrics", "RouteMetrics")
+
+
+class RouteMetrics:
+    """Metrics recorded for a single API endpoint.
+
+    .. versionadded:: 3.3
+
+    Attributes
+    ----------
+    requests: int
+        The amount of attempts made to this endpoint, including retries.
+    retries: int
+        The amount of attempts which were retries of a failed attempt.
+    errors: int
+        The amount of attempts which failed with a status code of ``400`` or greater, or a connection error.
+    statuses: collections.Counter[int]
+        A counter of the status codes received. Connection errors are counted as status ``0``.
+    latency_buckets: list[int]
+        The amount of attempts in each latency bucket of :attr:`HTTPMetrics.LATENCY_BUCKETS`, with an additional final
+        bucket for attempts slower than the largest bucket.
+    latency_sum: float
+        The total time in seconds spent on attempts to this endpoint.
+    latency_max: float
+        The slowest attempt to this endpoint in seconds.
+    bytes_received: int
+        The total size of the response bodies received from this endpoint.
+    ratelimit_remaining: int | None
+        The last ``Ratelimit-Remaining`` value received from this endpoint. Could be ``None``.
+    """
+
+    __slots__ = (
+        "bytes_received",
+        "errors",
+        "latency_buckets",
+        "latency_max",
+        "latency_sum",
+        "ratelimit_remaining",
+        "requests",
+        "retries",
+        "statuses",
+    )
+
+    def __init__(self, buckets: int) -> None:
+        self.requests: int = 0
+        self.retries: int = 0
+        self.errors: int = 0
+        self.statuses: Counter[int] = Counter()
+        self.latency_buckets: list[int] = [0] * (buckets + 1)
+        self.latency_sum: float = 0.0
+        self.latency_max: float = 0.0
+        self.bytes_received: int = 0
+        self.ratelimit_remaining: int | None = None
+
+    def __repr__(self) -> str:
+        return f"RouteMetrics(requests={self.requests}, errors={self.errors}, retries={self.retries})"
+
+    @property
+    def latency_avg(self) -> float:
+        """The average time in seconds of attempts to this endpoint."""
+        return self.latency_sum / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a plain :class:`dict` copy of these metrics."""
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "statuses": dict(self.statuses),
+            "latency_buckets": list(self.latency_buckets),
+            "latency_sum": self.latency_sum,
+            "latency_avg": self.latency_avg,
+            "latency_max": self.latency_max,
+            "bytes_received": self.bytes_received,
+            "ratelimit_remaining": self.ratelimit_remaining,
+        }
+
+
+class HTTPMetrics:
+    """In-process metrics of the requests made to the Twitch API, recorded per endpoint.
+
+    Endpoints are keyed by request method and templated path, E.g. ``"GET users"``, without query parameters.
+    Every attempt is recorded, including retries.
+
+    You can access the metrics of a :class:`~twitchio.Client` with :attr:`twitchio.Client.metrics`. To export metrics
+    elsewhere, subclass this class, override :meth:`record` and pass an instance to :class:`~twitchio.Client` with the
+    ``metrics`` parameter.
+
+    .. versionadded:: 3.3
+
+    Examples
+    --------
+
+    .. code:: python3
+
+        snapshot = client.metrics.snapshot()
+        print(snapshot["GET users"]["latency_avg"])
+    """
+
+    LATENCY_BUCKETS: ClassVar[tuple[float, ...]] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    __slots__ = ("_routes",)
+
+    def __init__(self) -> None:
+        self._routes: dict[str, RouteMetrics] = {}
+
+    def __repr__(self) -> str:
+        return f"HTTPMetrics(routes={len(self._routes)})"
+
+    def __getitem__(self, key: str) -> RouteMetrics:
+        return self._routes[key]
+
+    @staticmethod
+    def key(route: Route) -> str:
+        """Return the key the provided :class:`~twitchio.Route` is recorded under."""
+        return f"{route.method} {route.path}"
+
+    def get(self, key: str) -> RouteMetrics | None:
+        """Return the :class:`RouteMetrics` recorded under ``key``, E.g. ``"GET users"``, or ``None``."""
+        return self._routes.get(key)
+
+    def record(
+        self,
+        route: Route,
+        *,
+        status: int,
+        latency: float,
+        size: int = 0,
+        ratelimit_remaining: int | None = None,
+        retry: bool = False,
+    ) -> None:
+        """Record a single attempt of a request.
+
+        This is called by TwitchIO after each attempt and can be overridden to export metrics.
+
+        Parameters
+        ----------
+        route: :class:`~twitchio.Route`
+            The route of the request.
+        status: int
+            The status code received. ``0`` when the attempt failed with a connection error.
+        latency: float
+            The time in seconds the attempt took.
+        size: int
+            The size of the response body received.
+        ratelimit_remaining: int | None
+            The ``Ratelimit-Remaining`` header received, if any.
+        retry: bool
+            Whether this attempt was a retry of a failed attempt.
+        """
+        key: str = self.key(route)
+
+        try:
+            metrics: RouteMetrics = self._routes[key]
+        except KeyError:
+            metrics = self._routes[key] = RouteMetrics(len(self.LATENCY_BUCKETS))
+
+        metrics.requests += 1
+        metrics.retries += retry
+        metrics.errors += status == 0 or status >= 400
+        metrics.statuses[status] += 1
+        metrics.latency_buckets[bisect.bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+        metrics.latency_sum += latency
+        metrics.latency_max = max(metrics.latency_max, latency)
+        metrics.bytes_received += size
+
+        if ratelimit_remaining is not None:
+            metrics.ratelimit_remaining = ratelimit_remaining
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a plain :class:`dict` copy of the recorded metrics, keyed by endpoint.
+
+        The returned :class:`dict` is safe to serialize, E.g. to JSON.
+        """
+        return {key: metrics.to_dict() for key, metrics in self._routes.items()}
+
+    def reset(self) -> None:
+        """Clear all recorded metrics."""
+        self._routes.clear()
@@ -0,0 +1,379 @@
+"""
+MIT License
+
+Copyright (c) 2017 - Present PythonistaGuild
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+from .enums import RequestPriority
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+__all__ = ("PrioritySemaphore", "RateLimitBucket", "RateLimiter")
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def token_bucket_key(token: str) -> str:
+    """Return the bucket key for a token which is not associated with a known user.
+
+    Tokens are secret and bucket keys are logged, so the key is derived from a hash of the token.
+    """
+    return f"token:{hashlib.sha256(token.encode()).hexdigest()[:16]}"
+
+
+class PrioritySemaphore:
+    """A semaphore which releases waiters by :class:`~twitchio.RequestPriority` and then in FIFO order.
+
+    .. important::
+
+        Everything in this class is private internals, and should not be modified.
+    """
+
+    __slots__ = ("_counter", "_value", "_waiters")
+
+    def __init__(self, value: int = 1) -> None:
+        self._value: int = value
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter: itertools.count[int] = itertools.count()
+
+    def __repr__(self) -> str:
+        return f"PrioritySemaphore(value={self._value}, waiters={len(self._waiters)})"
+
+    def locked(self) -> bool:
+        return self._value <= 0
+
+    def idle(self) -> bool:
+        return not self.locked() and not self._waiters
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry: tuple[int, int, asyncio.Future[None]] = (int(priority), next(self._counter), future)
+        heapq.heappush(self._waiters, entry)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We were handed the slot as we were cancelled; pass it on to the next waiter...
+                self.release()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+
+            raise
+
+    def release(self) -> None:
+        # The slot is handed directly to the next waiter, so a new caller can not take it in between...
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self._value += 1
+
+
+class RateLimitBucket:
+    """A token bucket tracking the Helix rate limit for a single token.
+
+    Twitch replenishes each bucket continuously and reports the current state with the ``Ratelimit-Limit``,
+    ``Ratelimit-Remaining`` and ``Ratelimit-Reset`` headers on every response. The bucket reserves a point locally
+    before each request and is corrected by the headers of each response. When no points remain, requests are queued
+    and released at the reset time reported by Twitch, by :class:`~twitchio.RequestPriority` and then in FIFO order.
+
+    .. important::
+
+        Everything in this class is private internals, and should not be modified.
+    """
+
+    __slots__ = ("_lock", "_on_change", "key", "limit", "remaining", "reset")
+
+    def __init__(self, key: str, *, on_change: Callable[[RateLimitBucket], None] | None = None) -> None:
+        self.key: str = key
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: float = 0.0
+
+        self._lock: PrioritySemaphore = PrioritySemaphore()
+        self._on_change: Callable[[RateLimitBucket], None] | None = on_change
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change(self)
+
+    def __repr__(self) -> str:
+        return f"RateLimitBucket(key={self.key}, limit={self.limit}, remaining={self.remaining}, reset={self.reset})"
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the bucket currently has no points remaining before the reset time."""
+        if self.remaining is None or self.remaining > 0:
+            return False
+
+        return time.time() < self.reset
+
+    @property
+    def available(self) -> int | None:
+        """The amount of points expected to be available for a new request, or ``None`` if unknown."""
+        if self.remaining is None:
+            return None
+
+        if time.time() >= self.reset:
+            return max(self.limit or 0, self.remaining)
+
+        return max(self.remaining, 0)
+
+    def delay(self) -> float:
+        """The time in seconds until the bucket resets if it is exhausted, otherwise ``0``."""
+        if not self.exhausted:
+            return 0.0
+
+        return max(self.reset - time.time(), 0.0)
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.INTERACTIVE) -> None:
+        """Reserve a point in this bucket, waiting until the reset time if the bucket is exhausted.
+
+        Waiters are released by ``priority`` and then in FIFO order.
+        """
+        await self._lock.acquire(priority)
+
+        try:
+            delay: float = self.delay()
+
+            if delay > 0:
+                logger.debug("Rate limit bucket %r is exhausted. Queueing request for %.3fs.", self.key, delay)
+                await asyncio.sleep(delay)
+
+            if self.remaining is None:
+                return
+
+            if self.remaining <= 0:
+                # The reset time has passed; Twitch will have refilled at least part of the bucket...
+                self.remaining = self.limit or 1
+
+            self.remaining -= 1
+            self._changed()
+        finally:
+            self._lock.release()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the state of this bucket from the ``Ratelimit-*`` headers of a response."""
+        try:
+            limit: int = int(headers["Ratelimit-Limit"])
+            remaining: int = int(headers["Ratelimit-Remaining"])
+            reset: float = float(headers["Ratelimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        if reset < self.reset:
+            # Out of order response from an older window...
+            return
+
+        self.limit = limit
+        self.remaining = remaining if self.remaining is None or reset > self.reset else min(remaining, self.remaining)
+        self.reset = reset
+        self._changed()
+
+    def exhaust(self, reset: float | None = None) -> None:
+        """Mark the bucket as exhausted, E.g. after receiving a ``429``."""
+        self.remaining = 0
+
+        if reset is not None:
+            self.reset = max(self.reset, reset)
+
+        self._changed()
+
+
+class RateLimiter:
+    """Container mapping a token key to its :class:`RateLimitBucket`.
+
+    Tracked keys are also ranked by the amount of points available in their bucket, so the key with the most remaining
+    budget can be found without checking every bucket. The ranking is updated whenever a bucket changes, and buckets are
+    ranked again once their reset time passes.
+
+    .. important::
+
+        Everything in this class is private internals, and should not be modified.
+    """
+
+    PRUNE_INTERVAL: ClassVar[int] = 256
+
+    __slots__ = ("_buckets", "_counter", "_created", "_pending_resets", "_ranked", "_ranks", "_resets")
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, RateLimitBucket] = {}
+        self._created: int = 0
+
+        # Max-heap of (-available, seq, key). Entries are replaced rather than updated, so stale entries are skipped...
+        self._ranked: list[tuple[float, int, str]] = []
+        self._ranks: dict[str, int] = {}
+        self._resets: list[tuple[float, str]] = []
+        self._pending_resets: dict[str, float] = {}
+        self._counter: itertools.count[int] = itertools.count()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._buckets
+
+    def get(self, key: str) -> RateLimitBucket:
+        """Return the bucket for ``key``, creating it if it does not exist."""
+        try:
+            return self._buckets[key]
+        except KeyError:
+            pass
+
+        # Buckets of tokens which are no longer used, E.g. after being refreshed, are removed every so often...
+        self._created += 1
+        if self._created % self.PRUNE_INTERVAL == 0:
+            self.prune()
+
+        bucket = self._buckets[key] = RateLimitBucket(key, on_change=self._rank)
+        return bucket
+
+    def prune(self) -> int:
+        """Remove untracked buckets which are idle and whose reset time has passed, returning the amount removed.
+
+        These buckets hold no state which differs from a new bucket in any meaningful way.
+        """
+        now: float = time.time()
+        idle: list[str] = [
+            key
+            for key, bucket in self._buckets.items()
+            if key not in self._ranks and bucket.reset <= now and bucket._lock.idle()
+        ]
+
+        for key in idle:
+            del self._buckets[key]
+            self._pending_resets.pop(key, None)
+
+        return len(idle)
+
+    def available(self, key: str) -> float:
+        """Return the amount of points expected to be available in the bucket for ``key``.
+
+        Buckets without a known state are assumed to be full and return ``math.inf``.
+        """
+        bucket: RateLimitBucket | None = self._buckets.get(key)
+        available: int | None = bucket.available if bucket else None
+
+        return math.inf if available is None else available
+
+    def track(self, key: str) -> None:
+        """Start ranking ``key`` by its available points. See :meth:`best`."""
+        self._ranks.setdefault(key, -1)
+        self._rank(self.get(key))
+
+    def untrack(self, key: str) -> None:
+        """Stop ranking ``key``. Its entries are discarded lazily."""
+        self._ranks.pop(key, None)
+
+    def _rank(self, bucket: RateLimitBucket) -> None:
+        if bucket.key not in self._ranks:
+            return
+
+        available: float = self.available(bucket.key)
+        seq: int = next(self._counter)
+
+        self._ranks[bucket.key] = seq
+        heapq.heappush(self._ranked, (-available, seq, bucket.key))
+
+        if bucket.limit is not None and available < bucket.limit and self._pending_resets.get(bucket.key) != bucket.reset:
+            # The bucket refills at the reset time, so it must be ranked again then...
+            self._pending_resets[bucket.key] = bucket.reset
+            heapq.heappush(self._resets, (bucket.reset, bucket.key))
+
+    def best(self, predicate: Callable[[str], bool] | None = None) -> tuple[str | None, float]:
+        """Return the tracked key with the most available points, and the amount of points available.
+
+        When ``predicate`` is provided, only keys for which it returns ``True`` are considered. Keys rejected by the
+        predicate are checked in order of available points, so a rarely matching predicate may check many keys.
+
+        Returns ``(None, -1)`` if no tracked key matches.
+        """
+        now: float = time.time()
+
+        while self._resets and self._resets[0][0] <= now:
+            reset, key = heapq.heappop(self._resets)
+            if self._pending_resets.get(key) != reset:
+                continue
+
+            del self._pending_resets[key]
+            bucket: RateLimitBucket | None = self._buckets.get(key)
+
+            if bucket is not None:
+                self._rank(bucket)
+
+        skipped: list[tuple[float, int, str]] = []
+        found: tuple[str | None, float] = (None, -1)
+
+        while self._ranked:
+            entry: tuple[float, int, str] = self._ranked[0]
+            available, seq, key = entry
+
+            if self._ranks.get(key) != seq:
+                heapq.heappop(self._ranked)
+                continue
+
+            if predicate is None or predicate(key):
+                found = (key, -available)
+                break
+
+            skipped.append(heapq.heappop(self._ranked))
+
+        for entry in skipped:
+            heapq.heappush(self._ranked, entry)
+
+        return found
+
+    def remove(self, key: str) -> RateLimitBucket | None:
+        self.untrack(key)
+        return self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        tracked: list[str] = list(self._ranks)
+
+        self._buckets.clear()
+        self._ranked.clear()
+        self._ranks.clear()
+        self._resets.clear()
+        self._pending_resets.clear()
+
+        for key in tracked:
+            self.track(key)
@@ -31,20 +31,40 @@ from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 if TYPE_CHECKING:
     import aiohttp
 
-    from ..authentication import Scopes
+    from ..authentication import Scopes, TokenStore
+    from ..backoff import RetryPolicy
+    from ..cache import AssetCache, ResponseCache
     from ..eventsub.subscriptions import SubscriptionPayload
+    from ..http import ConnectionPool
+    from ..metrics import HTTPMetrics
     from ..web.utils import BaseAdapter
 
 
-__all__ = ("AutoClientOptions", "ClientOptions", "WaitPredicateT")
+__all__ = ("AutoClientOptions", "ClientOptions", "HTTPClientOptions", "WaitPredicateT")
 
 
-class ClientOptions(TypedDict, total=False):
+class HTTPClientOptions(TypedDict, total=False):
+    retry_policy: RetryPolicy | None
+    coalesce_requests: bool
+    response_cache: ResponseCache | None
+    asset_cache: AssetCache | None
+    connection_pool: ConnectionPool | None
+    metrics: HTTPMetrics | None
+    request_timeout: float | None
+    token_routing: bool
+    validation_concurrency: int
+    validation_jitter: float
+    defer_validation: bool
+    token_store: TokenStore | None
+
+
+class ClientOptions(HTTPClientOptions, total=False):
     redirect_uri: str | None
     scopes: Scopes | None
     session: aiohttp.ClientSession | None
     adapter: NotRequired[BaseAdapter[Any]]
     fetch_client_user: NotRequired[bool]
+    batch_window: NotRequired[float]
 
 
 class AutoClientOptions(ClientOptions, total=False):
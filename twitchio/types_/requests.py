@@ -25,6 +25,7 @@ SOFTWARE.
 from collections.abc import MutableMapping
 from typing import Any, Literal, TypeAlias, TypedDict
 
+from ..enums import RequestPriority
 from ..user import PartialUser
 
 
@@ -41,6 +42,10 @@ class APIRequestKwargs(TypedDict, total=False):
     params: ParamMapping
     json: Any
     token_for: str | PartialUser | None
+    priority: RequestPriority
+    timeout: float | None
+    routable: bool
+    scopes: list[str]
 
 
 class APIRequest(TypedDict, total=False):
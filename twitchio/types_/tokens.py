@@ -24,7 +24,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeAlias, TypedDict
+from typing import TYPE_CHECKING, NotRequired, TypeAlias, TypedDict
 
 
 if TYPE_CHECKING:
@@ -39,6 +39,7 @@ class TokenMappingData(TypedDict):
     token: str
     refresh: str
     last_validated: str
+    scopes: NotRequired[list[str]]
 
 
 class _TokenRefreshedPayload(TypedDict):
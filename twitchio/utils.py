@@ -36,7 +36,7 @@ import pathlib
 import struct
 import sys
 import typing
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Coroutine, Iterable
 from functools import wraps
 from typing import TYPE_CHECKING, Any, ForwardRef, Generic, Literal, Self, TypeVar, Union, cast
 from urllib.parse import quote
@@ -917,6 +917,62 @@ class EventWaiter:
         return True
 
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Shares a single in-flight task between every caller requesting the same key.
+
+    Each caller awaits a shielded task, so one caller being cancelled does not cancel the task for the others. When
+    ``cancel_unused`` is ``True``, the task is cancelled once every caller waiting on it has been cancelled.
+
+    .. important::
+
+        Everything in this class is private internals, and should not be modified.
+    """
+
+    __slots__ = ("_tasks", "_waiters", "cancel_unused")
+
+    def __init__(self, *, cancel_unused: bool = False) -> None:
+        self.cancel_unused: bool = cancel_unused
+
+        self._tasks: dict[K, asyncio.Task[V]] = {}
+        self._waiters: dict[asyncio.Task[V], int] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._tasks
+
+    async def run(self, key: K, factory: Callable[[], Coroutine[Any, Any, V]]) -> V:
+        task: asyncio.Task[V] | None = self._tasks.get(key)
+
+        if task is None:
+            task = self._tasks[key] = asyncio.create_task(factory())
+
+            def _done(fut: asyncio.Task[V]) -> None:
+                if self._tasks.get(key) is fut:
+                    del self._tasks[key]
+
+                # Mark the exception as retrieved in case every waiter was cancelled...
+                if not fut.cancelled():
+                    fut.exception()
+
+            task.add_done_callback(_done)
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining: int = self._waiters.pop(task) - 1
+
+            if remaining:
+                self._waiters[task] = remaining
+            elif self.cancel_unused and not task.done():
+                # Every waiter has given up, so the task is no longer needed...
+                task.cancel()
+
+
 F = TypeVar("F", bound=Callable[..., Any])
 
 